@@ -5,69 +5,167 @@ Analyze strategic datasets for Saudi Arabia's objectives
 
 import json
 import re
+from bisect import bisect_right
+from itertools import chain, islice
 
-def main():
-    # Read the JSON file
-    with open('/Users/raneem/VS/od_dataset/open_datasets.json', 'r') as f:
-        datasets = json.load(f)
-
-    # Define strategic categories and keywords
-    strategic_categories = {
-        'Nuclear Safety & Radiation': [
-            'nuclear', 'radiation', 'radioactive', 'reactor', 'uranium', 'nuclear safety', 
-            'nuclear power', 'nuclear regulatory', 'radiation safety', 'nuclear waste'
-        ],
-        'Solar & Renewable Energy': [
-            'solar radiation', 'solar energy', 'solar resource', 'photovoltaic', 'solar data',
-            'renewable energy', 'solar power', 'solar irradiance', 'wind energy', 'clean energy'
-        ],
-        'Research & Innovation': [
-            'national institute', 'research data', 'scientific data', 'innovation', 'technology',
-            'research and development', 'r&d', 'laboratory data'
-        ],
-        'Standards & Regulations': [
-            'standards', 'regulations', 'compliance', 'quality framework', 'technical standards',
-            'regulatory framework', 'safety standards', 'certification'
-        ],
-        'Energy Efficiency & Performance': [
-            'energy efficiency', 'performance data', 'energy performance', 'efficiency standards',
-            'energy monitoring', 'energy analytics'
-        ],
-        'International Collaboration': [
-            'international', 'collaboration', 'partnership', 'global', 'worldwide',
-            'international cooperation', 'multi-country'
-        ]
+try:
+    import ijson
+except ImportError:  # fall back to loading the whole file with json
+    ijson = None
+
+# Define strategic categories and keywords
+STRATEGIC_CATEGORIES = {
+    'Nuclear Safety & Radiation': [
+        'nuclear', 'radiation', 'radioactive', 'reactor', 'uranium', 'nuclear safety', 
+        'nuclear power', 'nuclear regulatory', 'radiation safety', 'nuclear waste'
+    ],
+    'Solar & Renewable Energy': [
+        'solar radiation', 'solar energy', 'solar resource', 'photovoltaic', 'solar data',
+        'renewable energy', 'solar power', 'solar irradiance', 'wind energy', 'clean energy'
+    ],
+    'Research & Innovation': [
+        'national institute', 'research data', 'scientific data', 'innovation', 'technology',
+        'research and development', 'r&d', 'laboratory data'
+    ],
+    'Standards & Regulations': [
+        'standards', 'regulations', 'compliance', 'quality framework', 'technical standards',
+        'regulatory framework', 'safety standards', 'certification'
+    ],
+    'Energy Efficiency & Performance': [
+        'energy efficiency', 'performance data', 'energy performance', 'efficiency standards',
+        'energy monitoring', 'energy analytics'
+    ],
+    'International Collaboration': [
+        'international', 'collaboration', 'partnership', 'global', 'worldwide',
+        'international cooperation', 'multi-country'
+    ]
+}
+
+# Limit to avoid too much output
+MAX_STRATEGIC_DATASETS = 50
+
+# Datasets classified per pattern scan
+BATCH_SIZE = 500
+
+def build_keyword_matcher(strategic_categories):
+    """
+    Compile every category keyword into one pattern that scans a text once.
+
+    The lookahead reports the longest keyword starting at each position, so
+    keywords that are a prefix of that match are recorded alongside it.
+    """
+    keyword_to_category = {}
+    keyword_rank = {}
+    for category, category_keywords in strategic_categories.items():
+        for rank, keyword in enumerate(category_keywords):
+            keyword_to_category[keyword.lower()] = category
+            keyword_rank[keyword.lower()] = (rank, keyword)
+
+    alternation = '|'.join(map(re.escape, sorted(keyword_to_category, key=len, reverse=True)))
+    pattern = re.compile(f'(?=({alternation}))')
+    prefixes = {
+        keyword: [other for other in keyword_to_category if keyword.startswith(other)]
+        for keyword in keyword_to_category
     }
+    return pattern, keyword_to_category, keyword_rank, prefixes
 
-    # Find strategic datasets
-    strategic_datasets = []
+def match_categories_batch(texts, matcher):
+    """
+    For each text, map each matching category to its first listed keyword found.
+
+    The texts are joined with NUL separators and scanned with a single
+    pattern pass; match positions are mapped back to texts by offset.
+    """
+    pattern, keyword_to_category, keyword_rank, prefixes = matcher
+
+    starts = []
+    position = 0
+    for text in texts:
+        starts.append(position)
+        position += len(text) + 1
+
+    found = [set() for _ in texts]
+    for match in pattern.finditer('\0'.join(texts)):
+        found[bisect_right(starts, match.start()) - 1].update(prefixes[match.group(1)])
+
+    results = []
+    for keywords in found:
+        matches = {}
+        for keyword in keywords:
+            category = keyword_to_category[keyword]
+            if category not in matches or keyword_rank[keyword] < matches[category]:
+                matches[category] = keyword_rank[keyword]
+        results.append({category: keyword for category, (_, keyword) in matches.items()})
+    return results
+
+def build_hot_tokens(strategic_categories):
+    """Smallest set of keywords such that every category keyword contains one"""
+    keywords = {keyword.lower() for category_keywords in strategic_categories.values()
+                for keyword in category_keywords}
+    return tuple(sorted(
+        keyword for keyword in keywords
+        if not any(other != keyword and other in keyword for other in keywords)
+    ))
 
+def iter_datasets(path):
+    """Yield datasets from the JSON array one at a time"""
+    if ijson is None:
+        with open(path, 'r') as f:
+            yield from json.load(f)
+        return
+
+    with open(path, 'rb') as f:
+        yield from ijson.items(f, 'item')
+
+def iter_batches(iterable, size):
+    """Group an iterable into lists of at most size items"""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+def combined_text(dataset):
+    """Lowercased title, description and keywords used for keyword matching"""
+    keyword_blob = ' '.join(dataset.get('keywords', []))
+    return f"{dataset.get('title', '')} {dataset.get('description', '')} {keyword_blob}".lower()
+
+def classify_batch(datasets, matcher, hot_pattern):
+    """Yield the strategic entries for each candidate dataset in the batch, in order"""
+    candidates = []
+    texts = []
     for dataset in datasets:
-        title = dataset.get('title', '').lower()
-        description = dataset.get('description', '').lower()
-        keywords = [k.lower() for k in dataset.get('keywords', [])]
-        organization = dataset.get('organization', '')
-        
-        # Combine text for searching
-        combined_text = f"{title} {description} {' '.join(keywords)}"
-        
-        # Check each strategic category
-        for category, category_keywords in strategic_categories.items():
-            for keyword in category_keywords:
-                if keyword.lower() in combined_text:
-                    strategic_datasets.append({
-                        'category': category,
-                        'title': dataset.get('title', ''),
-                        'organization': organization,
-                        'description': dataset.get('description', '')[:200] + '...',
-                        'url': dataset.get('source_url', ''),
-                        'keywords': dataset.get('keywords', [])[:10],  # First 10 keywords
-                        'matched_keyword': keyword
-                    })
-                    break  # Only add once per dataset
-            
-            if len(strategic_datasets) >= 50:  # Limit to avoid too much output
-                break
+        text = combined_text(dataset)
+        # Most datasets match nothing; reject them with one scan for any hot token
+        if hot_pattern.search(text):
+            candidates.append(dataset)
+            texts.append(text)
+
+    for dataset, matched_categories in zip(candidates, match_categories_batch(texts, matcher)):
+        yield [
+            {
+                'category': category,
+                'title': dataset.get('title', ''),
+                'organization': dataset.get('organization', ''),
+                'description': dataset.get('description', '')[:200] + '...',
+                'url': dataset.get('source_url', ''),
+                'keywords': dataset.get('keywords', [])[:10],  # First 10 keywords
+                'matched_keyword': matched_categories[category]
+            }
+            for category in STRATEGIC_CATEGORIES
+            if category in matched_categories
+        ]
+
+def main():
+    matcher = build_keyword_matcher(STRATEGIC_CATEGORIES)
+    hot_pattern = re.compile('|'.join(map(re.escape, build_hot_tokens(STRATEGIC_CATEGORIES))))
+
+    # Find strategic datasets, streaming the JSON file so parsing stops at the cap
+    strategic_datasets = []
+
+    batches = iter_batches(iter_datasets('/Users/raneem/VS/od_dataset/open_datasets.json'), BATCH_SIZE)
+    for entries in chain.from_iterable(classify_batch(batch, matcher, hot_pattern) for batch in batches):
+        strategic_datasets.extend(entries)
+        if len(strategic_datasets) >= MAX_STRATEGIC_DATASETS:
+            break
 
     # Sort by category and print results
     strategic_datasets.sort(key=lambda x: (x['category'], x['title']))
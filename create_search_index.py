@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Create full-text and trigram search indexes on the datasets table
+One-time migration used by the keyword search in database_viewer.py
+"""
+
+import psycopg2
+from database_config import DB_CONFIG
+
+def create_search_index():
+    print('🔎 CREATING SEARCH INDEXES')
+    print('=' * 70)
+
+    with psycopg2.connect(**DB_CONFIG) as conn:
+        with conn.cursor() as cur:
+            # Generated tsvector over title + description, kept in sync by Postgres
+            print('\n1️⃣ Adding ts column (rewrites the table, may take a while)...')
+            cur.execute('''
+                ALTER TABLE datasets ADD COLUMN IF NOT EXISTS ts tsvector
+                GENERATED ALWAYS AS (
+                    to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))
+                ) STORED
+            ''')
+            print('   ✅ Column ready: datasets.ts')
+
+            print('\n2️⃣ Creating GIN index on ts...')
+            cur.execute('CREATE INDEX IF NOT EXISTS datasets_ts_gin ON datasets USING gin (ts)')
+            print('   ✅ Index ready: datasets_ts_gin')
+
+            # Trigram index for residual ILIKE '%...%' queries on titles
+            print('\n3️⃣ Creating trigram index on title...')
+            cur.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+            cur.execute('''
+                CREATE INDEX IF NOT EXISTS datasets_title_trgm
+                ON datasets USING gin (title gin_trgm_ops)
+            ''')
+            print('   ✅ Index ready: datasets_title_trgm')
+
+        conn.commit()
+
+    print('\n' + '=' * 70)
+    print('✅ SEARCH INDEXES CREATED')
+    print('=' * 70)
+
+if __name__ == "__main__":
+    create_search_index()
@@ -6,12 +6,24 @@ Database Viewer - Simple interface to explore the datasets database
 import psycopg2
 from database_config import DB_CONFIG
 
+def has_search_index(cur):
+    """Check whether create_search_index.py has added the ts column"""
+    cur.execute("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'datasets' AND column_name = 'ts'
+    """)
+    return cur.fetchone() is not None
+
 def main():
     print("📊 DATASET DATABASE VIEWER")
     print("=" * 50)
     
     with psycopg2.connect(**DB_CONFIG) as conn:
         with conn.cursor() as cur:
+            full_text_search = has_search_index(cur)
+            if not full_text_search:
+                print("ℹ️  Run create_search_index.py for faster keyword search")
+            
             while True:
                 print("\nOptions:")
                 print("1. View total dataset count")
@@ -42,26 +54,50 @@ def main():
                 elif choice == "3":
                     keyword = input("Enter keyword to search: ").strip()
                     if keyword:
-                        cur.execute("""
-                            SELECT title, source_platform, source_url 
-                            FROM datasets 
-                            WHERE title ILIKE %s OR description ILIKE %s
-                            LIMIT 10
-                        """, (f"%{keyword}%", f"%{keyword}%"))
-                        results = cur.fetchall()
-                        print(f"\n🔍 Found {len(results)} datasets matching '{keyword}':")
-                        for title, platform, url in results:
-                            print(f"  {title[:60]}... ({platform})")
-                            print(f"    {url}")
+                        # Named (server-side) cursor streams rows instead of buffering them
+                        with conn.cursor(name='viewer_search') as search_cur:
+                            search_cur.itersize = 100
+                            if full_text_search:
+                                search_cur.execute("""
+                                    SELECT title, source_platform, source_url 
+                                    FROM datasets 
+                                    WHERE ts @@ plainto_tsquery('simple', %s)
+                                    LIMIT 10
+                                """, (keyword,))
+                            else:
+                                search_cur.execute("""
+                                    SELECT title, source_platform, source_url 
+                                    FROM datasets 
+                                    WHERE title ILIKE %s OR description ILIKE %s
+                                    LIMIT 10
+                                """, (f"%{keyword}%", f"%{keyword}%"))
+                            print(f"\n🔍 Datasets matching '{keyword}':")
+                            found = 0
+                            for title, platform, url in search_cur:
+                                found += 1
+                                print(f"  {title[:60]}... ({platform})")
+                                print(f"    {url}")
+                        print(f"Found {found} datasets matching '{keyword}'")
                 
                 elif choice == "4":
+                    # Read a random sample of pages instead of sorting the whole
+                    # table by RANDOM(), then shuffle just the sampled rows
                     cur.execute("""
                         SELECT title, description, source_platform, source_url 
-                        FROM datasets 
-                        ORDER BY RANDOM() 
+                        FROM datasets TABLESAMPLE SYSTEM (0.01)
+                        ORDER BY RANDOM()
                         LIMIT 5
                     """)
                     results = cur.fetchall()
+                    if len(results) < 5:
+                        # Table too small for the sample rate to yield enough rows
+                        cur.execute("""
+                            SELECT title, description, source_platform, source_url 
+                            FROM datasets 
+                            ORDER BY RANDOM() 
+                            LIMIT 5
+                        """)
+                        results = cur.fetchall()
                     print(f"\n🎲 Random sample datasets:")
                     for i, (title, desc, platform, url) in enumerate(results, 1):
                         print(f"\n{i}. {title}")
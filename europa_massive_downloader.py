@@ -5,38 +5,144 @@ Downloads remaining datasets from data.europa.eu using the updated API format
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import csv
+import hashlib
+import io
 import json
+import re
 import time
 import psycopg2
-from typing import Dict, List, Set
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from itertools import islice
+from operator import itemgetter
+from psycopg2.extras import execute_values
+from typing import Dict, List, Optional
 from database_config import DB_CONFIG
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import threading
 
+# Column order shared by the COPY staging load and the INSERT fallback
+DATASET_COLUMNS = (
+    'title', 'description', 'keywords', 'source_url', 'organization',
+    'publication_date', 'last_modified_date', 'format', 'license',
+    'source_platform', 'raw_id', 'author', 'maintainer', 'download_url',
+    'groups', 'code', 'data_availability', 'metadata_availability', 'concepts'
+)
+ARRAY_COLUMNS = {'keywords', 'format', 'download_url', 'groups'}
+# Unquoted empty CSV fields load as NULL; only the timestamps and None arrays
+# (see to_pg_array) should do that
+NOT_NULL_COLUMNS = tuple(
+    col for col in DATASET_COLUMNS
+    if col not in ('publication_date', 'last_modified_date') and col not in ARRAY_COLUMNS
+)
+
+# Chunks kept in flight per download worker, bounding memory for large batches
+CHUNK_WINDOW_FACTOR = 2
+
+# Metadata for one Europa dataset, with fields in DATASET_COLUMNS order
+EuropaMeta = namedtuple('EuropaMeta', DATASET_COLUMNS)
+
+# Defaults for dataset dicts missing a column; timestamps stay NULL
+DATASET_DEFAULTS = {
+    col: [] if col in ARRAY_COLUMNS else ''
+    for col in DATASET_COLUMNS
+}
+DATASET_DEFAULTS['publication_date'] = None
+DATASET_DEFAULTS['last_modified_date'] = None
+_dataset_values = itemgetter(*DATASET_COLUMNS)
+
+# Constant Europa metadata values, shared by every row. Array values stay
+# lists because psycopg2 adapts lists (not tuples) to TEXT[]
+_EUROPA_URL_PREFIX = 'https://data.europa.eu/data/datasets/'
+_EUROPA_KEYWORDS = ['european data', 'open data', 'government data']
+_EUROPA_FORMAT = ['Unknown']
+_EUROPA_GROUPS = ['european-data', 'open-data']
+# Ids matching _SAFE_ID need no JSON escaping, so they fill the template directly
+_CONCEPTS_TMPL = '{"type": "european_dataset", "id": "%s"}'
+_SAFE_ID = re.compile(r'[A-Za-z0-9_-]+')
+
+def to_pg_array(values) -> Optional[str]:
+    """Format a list of strings as a PostgreSQL TEXT[] literal; None stays NULL"""
+    if values is None:
+        return None
+    items = (
+        '"' + str(v).replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for v in values
+    )
+    return '{' + ','.join(items) + '}'
+
+def europa_id_hash(dataset_id: str) -> int:
+    """Signed 64-bit hash of a dataset id; matches the SQL in get_existing_europa_ids"""
+    return int.from_bytes(hashlib.md5(dataset_id.encode('utf-8')).digest()[:8], 'big', signed=True)
+
+class EuropaIdIndex:
+    """
+    Exact membership over 64-bit dataset id hashes.
+
+    Ids loaded from the database live in one sorted array (8 bytes each);
+    ids saved during the run go into a small set alongside it.
+    """
+    
+    def __init__(self, sorted_hashes: array):
+        self._hashes = sorted_hashes
+        self._added = set()
+    
+    def add(self, dataset_id: str):
+        self._added.add(europa_id_hash(dataset_id))
+    
+    def __contains__(self, dataset_id: str) -> bool:
+        h = europa_id_hash(dataset_id)
+        if h in self._added:
+            return True
+        i = bisect_left(self._hashes, h)
+        return i < len(self._hashes) and self._hashes[i] == h
+    
+    def __len__(self) -> int:
+        return len(self._hashes) + len(self._added)
+
 class EuropaMassiveDownloader:
-    def __init__(self, db_config: Dict = None, num_workers: int = 8):
+    def __init__(self, db_config: Dict = None, num_workers: int = 32, use_copy: bool = True):
         self.db_config = db_config or DB_CONFIG
         self.num_workers = num_workers
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'OpenDataDownloader/1.0'
-        })
+        self.use_copy = use_copy
         self.lock = threading.Lock()
         
     def get_connection(self):
         """Get database connection"""
         return psycopg2.connect(**self.db_config)
     
-    def get_existing_europa_urls(self) -> Set[str]:
-        """Get set of existing European URLs to avoid duplicates"""
+    def get_existing_europa_ids(self) -> EuropaIdIndex:
+        """Get hashes of existing European dataset ids to avoid duplicates"""
+        hashes = array('q')
         try:
             with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute("SELECT source_url FROM datasets WHERE source_platform = 'data.europa.eu'")
-                    return set(row[0] for row in cursor.fetchall())
+                # Postgres hashes and sorts; the named cursor streams 8-byte ints
+                with conn.cursor(name='europa_ids') as cursor:
+                    cursor.itersize = 10000
+                    cursor.execute("""
+                        SELECT ('x' || left(md5(raw_id), 16))::bit(64)::bigint AS id_hash
+                        FROM datasets
+                        WHERE source_platform = 'data.europa.eu'
+                        ORDER BY id_hash
+                    """)
+                    hashes.extend(row[0] for row in cursor)
         except Exception as e:
-            print(f"Error getting existing Europa URLs: {e}")
-            return set()
+            print(f"Error getting existing Europa ids: {e}")
+        return EuropaIdIndex(hashes)
+    
+    def dataset_row(self, dataset) -> tuple:
+        """Build an insert row in DATASET_COLUMNS order"""
+        if isinstance(dataset, EuropaMeta):
+            return dataset
+        row = {**DATASET_DEFAULTS, **dataset}
+        # Empty timestamps load as NULL rather than failing the timestamp cast
+        row['publication_date'] = row['publication_date'] or None
+        row['last_modified_date'] = row['last_modified_date'] or None
+        return _dataset_values(row)
     
     def save_datasets_batch(self, datasets: List[Dict]):
         """Save multiple datasets in a single transaction"""
@@ -44,52 +150,70 @@ class EuropaMassiveDownloader:
             return 0
         
         try:
-            with self.get_connection() as conn:
-                with conn.cursor() as cursor:
-                    insert_query = """
-                        INSERT INTO datasets (
-                            title, description, keywords, source_url, organization,
-                            publication_date, last_modified_date, format, license,
-                            source_platform, raw_id, author, maintainer, download_url,
-                            groups, code, data_availability, metadata_availability, concepts
-                        ) VALUES (
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s, %s, %s, %s
-                        ) ON CONFLICT (source_url) DO NOTHING
-                    """
-                    
-                    batch_data = []
-                    for dataset in datasets:
-                        batch_data.append((
-                            dataset.get('title', ''),
-                            dataset.get('description', ''),
-                            dataset.get('keywords', []),
-                            dataset.get('source_url', ''),
-                            dataset.get('organization', ''),
-                            dataset.get('publication_date') or None,
-                            dataset.get('last_modified_date') or None,
-                            dataset.get('format', []),
-                            dataset.get('license', ''),
-                            dataset.get('source_platform', ''),
-                            dataset.get('raw_id', ''),
-                            dataset.get('author', ''),
-                            dataset.get('maintainer', ''),
-                            dataset.get('download_url', []),
-                            dataset.get('groups', []),
-                            dataset.get('code', ''),
-                            dataset.get('data_availability', ''),
-                            dataset.get('metadata_availability', ''),
-                            dataset.get('concepts', '')
-                        ))
-                    
-                    cursor.executemany(insert_query, batch_data)
-                    conn.commit()
-                    return len(batch_data)
+            if self.use_copy:
+                try:
+                    return self._copy_load(datasets)
+                except (csv.Error, psycopg2.DataError) as e:
+                    print(f"COPY failed for Europa batch, falling back to INSERT: {e}")
+            return self._insert_batch(datasets)
         except Exception as e:
             print(f"Error saving Europa batch: {e}")
             return 0
     
-    def extract_europa_metadata_from_string(self, dataset_str: str) -> Dict:
+    def _copy_load(self, datasets: List[Dict]) -> int:
+        """Stream a batch through COPY into a staging table, then merge into datasets"""
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for dataset in datasets:
+            row = self.dataset_row(dataset)
+            writer.writerow([
+                to_pg_array(value) if col in ARRAY_COLUMNS else value
+                for col, value in zip(DATASET_COLUMNS, row)
+            ])
+        buf.seek(0)
+        
+        columns = ', '.join(DATASET_COLUMNS)
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                # Temp tables already skip WAL; a lost commit is re-downloaded next run
+                cursor.execute("SET LOCAL synchronous_commit = off")
+                cursor.execute(
+                    "CREATE TEMP TABLE datasets_stage "
+                    "(LIKE datasets INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                cursor.copy_expert(
+                    f"COPY datasets_stage ({columns}) FROM STDIN WITH "
+                    f"(FORMAT csv, FORCE_NOT_NULL ({', '.join(NOT_NULL_COLUMNS)}))",
+                    buf
+                )
+                cursor.execute(f"""
+                    INSERT INTO datasets ({columns})
+                    SELECT {columns} FROM datasets_stage
+                    ON CONFLICT (source_url) DO NOTHING
+                """)
+                saved = cursor.rowcount
+            conn.commit()
+            return saved
+    
+    def _insert_batch(self, datasets: List[Dict]) -> int:
+        """Fallback multi-VALUES INSERT path"""
+        with self.get_connection() as conn:
+            with conn.cursor() as cursor:
+                insert_query = f"""
+                    INSERT INTO datasets ({', '.join(DATASET_COLUMNS)})
+                    VALUES %s
+                    ON CONFLICT (source_url) DO NOTHING
+                """
+                
+                batch_data = list(map(self.dataset_row, datasets))
+                
+                cursor.execute("SET LOCAL synchronous_commit = off")
+                execute_values(cursor, insert_query, batch_data, page_size=1000)
+                conn.commit()
+                return len(batch_data)
+    
+    @staticmethod
+    def extract_europa_metadata_from_string(dataset_str: str) -> Optional[EuropaMeta]:
         """Extract metadata from Europa dataset string format"""
         try:
             # The new API returns strings that are actually dataset IDs
@@ -98,45 +222,99 @@ class EuropaMassiveDownloader:
             
             # Skip if empty or invalid
             if not dataset_id or len(dataset_id) < 3:
-                return {}
+                return None
             
             # Create basic metadata structure
-            source_url = f"https://data.europa.eu/data/datasets/{dataset_id}"
+            source_url = _EUROPA_URL_PREFIX + dataset_id
+            if _SAFE_ID.fullmatch(dataset_id):
+                concepts = _CONCEPTS_TMPL % dataset_id
+            else:
+                concepts = f'{{"type": "european_dataset", "id": {json.dumps(dataset_id)}}}'
             
-            return {
-                'title': f"European Dataset {dataset_id}",
-                'description': f"Dataset from the European Data Portal with ID: {dataset_id}",
-                'keywords': ['european data', 'open data', 'government data'],
-                'source_url': source_url,
-                'organization': 'European Data Portal',
-                'publication_date': '',
-                'last_modified_date': '',
-                'format': ['Unknown'],
-                'license': 'Various European Licenses',
-                'source_platform': 'data.europa.eu',
-                'raw_id': dataset_id,
-                'author': 'European Data Portal',
-                'maintainer': 'European Data Portal',
-                'download_url': [source_url],
-                'groups': ['european-data', 'open-data'],
-                'code': dataset_id,
-                'data_availability': 'metadata_only',
-                'metadata_availability': 'available',
-                'concepts': json.dumps({'type': 'european_dataset', 'id': dataset_id})
-            }
+            return EuropaMeta(
+                title=f"European Dataset {dataset_id}",
+                description=f"Dataset from the European Data Portal with ID: {dataset_id}",
+                keywords=_EUROPA_KEYWORDS,
+                source_url=source_url,
+                organization='European Data Portal',
+                publication_date=None,
+                last_modified_date=None,
+                format=_EUROPA_FORMAT,
+                license='Various European Licenses',
+                source_platform='data.europa.eu',
+                raw_id=dataset_id,
+                author='European Data Portal',
+                maintainer='European Data Portal',
+                download_url=[source_url],
+                groups=_EUROPA_GROUPS,
+                code=dataset_id,
+                data_availability='metadata_only',
+                metadata_availability='available',
+                concepts=concepts
+            )
         except Exception as e:
             print(f"Error extracting Europa metadata from string: {e}")
-            return {}
+            return None
+
+# Throttling and transient server errors, retried with backoff (honouring Retry-After)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Minimum gap between chunk requests across all download threads, keeping
+# the old one-request-per-0.1s pace however many threads are running
+REQUEST_INTERVAL = 0.1
+
+# HTTP session shared by all download threads so keep-alive connections persist
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def get_session(pool_size: int = 32) -> requests.Session:
+    """Get the shared session, creating it on first use"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = requests.Session()
+            _SESSION.headers.update({'User-Agent': 'OpenDataDownloader/1.0'})
+            _SESSION.mount('https://', HTTPAdapter(
+                pool_maxsize=pool_size,
+                max_retries=Retry(
+                    total=3, backoff_factor=0.5,
+                    status_forcelist=RETRY_STATUSES,
+                    respect_retry_after_header=True
+                )
+            ))
+        return _SESSION
+
+class RequestPacer:
+    """Spaces request starts at least interval seconds apart across threads"""
+    
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+    
+    def wait(self):
+        """Block until the calling thread may start its request"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+_PACER = RequestPacer(REQUEST_INTERVAL)
 
 def download_europa_chunk(args):
-    """Download a chunk of Europa datasets"""
-    start_offset, chunk_size, existing_urls = args
+    """
+    Download a chunk of Europa datasets, returned with the chunk's start offset.
+    Datasets are None when the chunk failed and should be retried.
+    """
+    start_offset, chunk_size, known_ids = args
     
-    session = requests.Session()
-    session.headers.update({'User-Agent': 'OpenDataDownloader/1.0'})
+    session = get_session()
     
     try:
         # Get data from Europa API
+        _PACER.wait()
         response = session.get(
             'https://data.europa.eu/api/hub/repo/datasets',
             params={'limit': chunk_size, 'offset': start_offset},
@@ -145,35 +323,33 @@ def download_europa_chunk(args):
         
         if response.status_code != 200:
             print(f"Chunk {start_offset}: HTTP {response.status_code}")
-            return []
+            return start_offset, None
         
         data = response.json()
         
         # Handle the new string-based format
         if not isinstance(data, list):
             print(f"Chunk {start_offset}: Unexpected data format")
-            return []
+            return start_offset, None
         
         if not data:
             print(f"Chunk {start_offset}: No data returned")
-            return []
+            return start_offset, []
         
-        downloader = EuropaMassiveDownloader()
+        extract_metadata = EuropaMassiveDownloader.extract_europa_metadata_from_string
         datasets = []
         
         for dataset_str in data:
-            metadata = downloader.extract_europa_metadata_from_string(dataset_str)
-            if metadata and metadata.get('source_url'):
-                # Skip if already exists
-                if metadata['source_url'] in existing_urls:
-                    continue
+            metadata = extract_metadata(dataset_str)
+            # Exact id index; ON CONFLICT (source_url) catches the rest
+            if metadata and metadata.raw_id not in known_ids:
                 datasets.append(metadata)
         
-        return datasets
+        return start_offset, datasets
         
     except Exception as e:
         print(f"Error downloading Europa chunk {start_offset}: {e}")
-        return []
+        return start_offset, None
 
 def main():
     print("Europa Massive Downloader")
@@ -189,17 +365,16 @@ def main():
     
     print(f"Current Europa datasets: {current_count:,}")
     
-    # Get existing URLs
-    existing_urls = downloader.get_existing_europa_urls()
-    print(f"Found {len(existing_urls)} existing Europa URLs")
+    # Get existing dataset ids
+    known_ids = downloader.get_existing_europa_ids()
     
     # Ask user for batch size
     try:
         batch_size = int(input("Number of datasets to download (default 100000): ") or "100000")
-        num_workers = int(input("Number of parallel workers (default 8): ") or "8")
+        num_workers = int(input("Number of parallel downloads (default 32): ") or "32")
     except (ValueError, EOFError):
         batch_size = 100000
-        num_workers = 8
+        num_workers = 32
     
     # Calculate starting offset (from current count)
     start_offset = current_count
@@ -215,48 +390,54 @@ def main():
     chunks = []
     for i in range(num_chunks):
         chunk_start = start_offset + (i * chunk_size)
-        chunks.append((chunk_start, chunk_size, existing_urls))
+        chunks.append((chunk_start, chunk_size, known_ids))
     
-    # Download in parallel
+    # Download in parallel; requests release the GIL while waiting on the network
+    get_session(pool_size=num_workers)
     total_saved = 0
     chunk_count = 0
+    failed_offsets = []
     
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        # Submit all chunks
-        future_to_chunk = {
-            executor.submit(download_europa_chunk, chunk): chunk 
-            for chunk in chunks
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        # Keep a bounded window of chunks in flight and save each one as soon
+        # as it finishes, so a slow chunk doesn't hold back the ones after it
+        pending_chunks = iter(chunks)
+        in_flight = {
+            executor.submit(download_europa_chunk, chunk)
+            for chunk in islice(pending_chunks, num_workers * CHUNK_WINDOW_FACTOR)
         }
         
-        # Process completed chunks
-        for future in as_completed(future_to_chunk):
-            chunk = future_to_chunk[future]
-            try:
-                datasets = future.result()
-                if datasets:
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                next_chunk = next(pending_chunks, None)
+                if next_chunk is not None:
+                    in_flight.add(executor.submit(download_europa_chunk, next_chunk))
+                
+                chunk_start, datasets = future.result()
+                if datasets is None:
+                    failed_offsets.append(chunk_start)
+                elif datasets:
                     saved = downloader.save_datasets_batch(datasets)
                     total_saved += saved
                     chunk_count += 1
-                    print(f"Chunk {chunk[0]:,}: Downloaded {len(datasets)} datasets, saved {saved} new")
+                    print(f"Chunk {chunk_start:,}: Downloaded {len(datasets)} datasets, saved {saved} new")
                     
-                    # Update existing URLs set
+                    # Update the id index
                     for dataset in datasets:
-                        existing_urls.add(dataset['source_url'])
+                        known_ids.add(dataset.raw_id)
                     
                     # Progress update every 10 chunks
                     if chunk_count % 10 == 0:
                         print(f"Progress: {chunk_count}/{len(chunks)} chunks completed, {total_saved:,} new datasets saved")
                 else:
-                    print(f"Chunk {chunk[0]:,}: No datasets found")
-                    
-            except Exception as e:
-                print(f"Chunk {chunk[0]:,} generated an exception: {e}")
-            
-            # Small delay to be respectful to the API
-            time.sleep(0.1)
+                    print(f"Chunk {chunk_start:,}: No datasets found")
     
     print(f"\nEuropa massive download completed!")
     print(f"Total new datasets saved: {total_saved:,}")
+    if failed_offsets:
+        print(f"{len(failed_offsets)} chunks failed after retries, re-run to fetch offsets: "
+              f"{', '.join(f'{offset:,}' for offset in sorted(failed_offsets))}")
     
     # Show final stats
     with downloader.get_connection() as conn:
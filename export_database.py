@@ -4,9 +4,14 @@ Export database tables to CSV files
 """
 
 import psycopg2
-import csv
 from database_config import DB_CONFIG
 
+def copy_query_to_csv(cur, query, path):
+    """Stream a query result to a CSV file via COPY; returns the row count"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        cur.copy_expert(f'COPY ({query}) TO STDOUT WITH CSV HEADER', f)
+    return cur.rowcount
+
 def export_to_csv():
     print('📦 EXPORTING DATABASE TO CSV')
     print('=' * 70)
@@ -18,72 +23,46 @@ def export_to_csv():
 
             # Option 1: Export sample (first 10,000 records)
             print('   Exporting sample (10,000 records)...')
-            cur.execute('''
+            rows = copy_query_to_csv(cur, '''
                 SELECT * FROM datasets
                 ORDER BY id
                 LIMIT 10000
-            ''')
-
-            columns = [desc[0] for desc in cur.description]
-            rows = cur.fetchall()
+            ''', 'data/datasets_sample.csv')
 
-            with open('data/datasets_sample.csv', 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(columns)
-                writer.writerows(rows)
-
-            print(f'   ✅ Saved: data/datasets_sample.csv ({len(rows):,} records)')
+            print(f'   ✅ Saved: data/datasets_sample.csv ({rows:,} records)')
 
             # Export en_datasets table
             print('\n2️⃣ Exporting en_datasets table...')
-            cur.execute('''
+            rows = copy_query_to_csv(cur, '''
                 SELECT id, title, title_en, description, description_en,
                        detected_language, source_platform, source_url
                 FROM en_datasets
                 WHERE title_en IS NOT NULL
                 LIMIT 10000
-            ''')
-
-            columns = [desc[0] for desc in cur.description]
-            rows = cur.fetchall()
+            ''', 'data/en_datasets_sample.csv')
 
-            with open('data/en_datasets_sample.csv', 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(columns)
-                writer.writerows(rows)
-
-            print(f'   ✅ Saved: data/en_datasets_sample.csv ({len(rows):,} records)')
+            print(f'   ✅ Saved: data/en_datasets_sample.csv ({rows:,} records)')
 
             # Export statistics
             print('\n3️⃣ Exporting statistics...')
 
             # Language distribution
-            cur.execute('''
-                SELECT detected_language, COUNT(*) as count
+            copy_query_to_csv(cur, '''
+                SELECT detected_language AS language, COUNT(*) as count
                 FROM en_datasets
                 GROUP BY detected_language
                 ORDER BY count DESC
-            ''')
-
-            with open('data/language_stats.csv', 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['language', 'count'])
-                writer.writerows(cur.fetchall())
+            ''', 'data/language_stats.csv')
 
             print('   ✅ Saved: data/language_stats.csv')
 
             # Platform distribution
-            cur.execute('''
-                SELECT source_platform, COUNT(*) as count
+            copy_query_to_csv(cur, '''
+                SELECT source_platform AS platform, COUNT(*) as count
                 FROM datasets
                 GROUP BY source_platform
                 ORDER BY count DESC
-            ''')
-
-            with open('data/platform_stats.csv', 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['platform', 'count'])
-                writer.writerows(cur.fetchall())
+            ''', 'data/platform_stats.csv')
 
             print('   ✅ Saved: data/platform_stats.csv')
 
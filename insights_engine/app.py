@@ -3,97 +3,224 @@ Insights Engine Flask Application
 Main application entry point for the AI-Powered Government Data Intelligence Platform
 """
 
-from flask import Flask, request, jsonify, render_template, send_from_directory
+import os
+
+# Patch blocking stdlib I/O before anything else imports it (see gunicorn.conf.py)
+if os.environ.get('INSIGHTS_GEVENT') == '1':
+    from gevent import monkey
+    monkey.patch_all()
+
+from flask import Flask, request, jsonify, render_template, stream_with_context
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
 from flask_cors import CORS
 import logging
-import os
+import time
 from datetime import datetime
+from decimal import Decimal
+from functools import cached_property
+
+import orjson
 
 from app.router import ExpertRouter
 from app.context_engine import ContextEngine
 from app.data_loader import DataLoader
 from app.publisher import OpenDataPublisher
 
+# Seconds /api/experts reuses the expert listing before rebuilding it
+EXPERTS_CACHE_TTL = 60
+
+
+def _orjson_default(obj):
+    """Serialize the types Flask's default provider handles but orjson does not."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that encodes responses with orjson instead of the json module."""
+    
+    sort_keys = True
+    compact = None
+    
+    def _options(self):
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if self.compact is False or (self.compact is None and self._app.debug):
+            options |= orjson.OPT_INDENT_2
+        return options
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_orjson_default, option=self._options()).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_orjson_default, option=self._options()),
+            mimetype='application/json'
+        )
+
+
+class Services:
+    """
+    Application components, each built on first use in the process that
+    needs it, so forked workers don't pay for (or copy) unused state.
+    """
+    
+    def __init__(self, logger):
+        self.logger = logger
+    
+    @cached_property
+    def expert_router(self):
+        return ExpertRouter()
+    
+    @cached_property
+    def context_engine(self):
+        return ContextEngine()
+    
+    @cached_property
+    def data_loader(self):
+        data_loader = DataLoader()
+        
+        # Load reference data
+        try:
+            data_loader.create_sample_data_files()  # Create sample files if needed
+            reference_files = data_loader.index()
+            self.logger.info(f"Indexed {len(reference_files)} reference data files")
+        except Exception as e:
+            self.logger.error(f"Failed to load reference data: {str(e)}")
+        
+        return data_loader
+    
+    @cached_property
+    def publisher(self):
+        return OpenDataPublisher()
+    
+    def warm(self):
+        """Build every component now instead of on the first request."""
+        for name in ('expert_router', 'context_engine', 'data_loader', 'publisher'):
+            getattr(self, name)
+
 
 def create_app(config_name='development'):
     """Application factory pattern for creating Flask app."""
+    # Pages and styles are served from static/ by Flask's static view at the
+    # site root; in production a reverse proxy can serve that folder directly
     app = Flask(__name__, 
                 static_folder='static', 
+                static_url_path='',
                 template_folder='templates')
+    app.json = OrjsonProvider(app)
     
     # Enable CORS for frontend integration
     CORS(app)
     
+    # Emit keys in insertion order and skip pretty-printing, even in debug
+    app.json.sort_keys = False
+    app.json.compact = True
+    
     # Load configuration
     app.config.from_object(f'config.{config_name.title()}Config')
     
+    # Compress JSON and page responses for clients that accept br/gzip
+    Compress(app)
+    
     # Setup logging
     setup_logging(app)
     
-    # Initialize components
-    expert_router = ExpertRouter()
-    context_engine = ContextEngine()
-    data_loader = DataLoader()
-    publisher = OpenDataPublisher()
+    # Components are created lazily; see Services
+    services = Services(app.logger)
+    app.extensions['services'] = services
     
-    # Load reference data
-    try:
-        data_loader.create_sample_data_files()  # Create sample files if needed
-        reference_data = data_loader.load_all_reference_data()
-        app.logger.info(f"Loaded reference data: {list(reference_data.keys())}")
-    except Exception as e:
-        app.logger.error(f"Failed to load reference data: {str(e)}")
+    # Health payload is constant apart from its timestamp
+    health_template = {
+        "status": "healthy",
+        "timestamp": None,
+        "version": "1.0.0",
+        "components": {
+            "expert_router": "active",
+            "context_engine": "active",
+            "data_loader": "active",
+            "publisher": "active"
+        }
+    }
+    experts_cache = {"expires": 0.0, "experts": None}
     
     # Routes
     @app.route('/')
     def index():
         """Serve the main interface."""
-        return send_from_directory('../', 'index.html')
-    
-    @app.route('/usecase.html')
-    def usecase_page():
-        """Serve the use case generation page."""
-        return send_from_directory('../', 'usecase.html')
-    
-    @app.route('/publishing.html')
-    def publishing_page():
-        """Serve the publishing recommendations page."""
-        return send_from_directory('../', 'publishing.html')
-    
-    @app.route('/style.css')
-    def styles():
-        """Serve the stylesheet."""
-        return send_from_directory('../', 'style.css')
+        return app.send_static_file('index.html')
     
     @app.route('/api/health', methods=['GET'])
     def health_check():
         """Health check endpoint."""
-        return jsonify({
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "version": "1.0.0",
-            "components": {
-                "expert_router": "active",
-                "context_engine": "active",
-                "data_loader": "active",
-                "publisher": "active"
-            }
-        })
+        return jsonify({**health_template, "timestamp": datetime.now()})
     
     @app.route('/api/experts', methods=['GET'])
     def get_experts():
         """Get information about available experts."""
         try:
-            experts_info = expert_router.get_available_experts()
+            now = time.monotonic()
+            if now >= experts_cache["expires"]:
+                experts_cache["experts"] = services.expert_router.get_available_experts()
+                experts_cache["expires"] = now + EXPERTS_CACHE_TTL
+            experts_info = experts_cache["experts"]
             return jsonify({
                 "experts": experts_info,
                 "total_count": len(experts_info),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now()
             })
         except Exception as e:
             app.logger.error(f"Error getting experts info: {str(e)}")
             return jsonify({"error": "Failed to retrieve experts information"}), 500
     
+    def use_case_summary(routing_log, enriched_context):
+        """Routing and context details reported alongside generated use cases."""
+        return {
+            "routing_info": {
+                "experts_used": len(routing_log['selected_experts']),
+                "selected_experts": [expert['name'] for expert in routing_log['selected_experts']],
+                "routing_strategy": routing_log['routing_strategy']
+            },
+            "context_info": {
+                "domain_classification": enriched_context.get('domain_classification', []),
+                "strategic_alignment": enriched_context.get('strategic_alignment', 0.0),
+                "content_richness": enriched_context.get('content_richness', 0.0)
+            },
+            "generation_timestamp": datetime.now()
+        }
+    
+    def stream_use_cases(dataset_name, enriched_context):
+        """Yield one NDJSON line per use case, then a summary line."""
+        try:
+            experts, routing_log = services.expert_router.route_to_experts(enriched_context)
+            use_case_count = 0
+            for _, use_case, _ in services.expert_router.iter_use_cases(enriched_context, experts):
+                if use_case is not None:
+                    use_case_count += 1
+                    yield app.json.dumps({"use_case": use_case}) + "\n"
+            
+            try:
+                services.expert_router.save_routing_log(routing_log)
+            except Exception as e:
+                app.logger.warning(f"Failed to save routing log: {str(e)}")
+            
+            app.logger.info(f"Generated {use_case_count} use cases for dataset: {dataset_name}")
+            yield app.json.dumps({"success": True, **use_case_summary(routing_log, enriched_context)}) + "\n"
+            
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band
+            app.logger.error(f"Error generating use cases: {str(e)}")
+            yield app.json.dumps({"error": "Failed to generate use cases", "details": str(e)}) + "\n"
+    
     @app.route('/api/use-cases/generate', methods=['POST'])
     def generate_use_cases():
         """Generate use cases from dataset metadata."""
@@ -112,10 +239,10 @@ def create_app(config_name='development'):
             
             # Process context
             app.logger.info(f"Processing dataset: {input_data['name']}")
-            enriched_context = context_engine.process_context(input_data)
+            enriched_context = services.context_engine.process_context(input_data)
             
             # Validate context
-            validation_results = context_engine.validate_context(enriched_context)
+            validation_results = services.context_engine.validate_context(enriched_context)
             
             if not validation_results['is_valid']:
                 return jsonify({
@@ -123,12 +250,19 @@ def create_app(config_name='development'):
                     "validation_errors": validation_results['errors']
                 }), 400
             
+            # Clients asking for NDJSON get each use case as soon as its expert finishes
+            if request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson']) == 'application/x-ndjson':
+                return app.response_class(
+                    stream_with_context(stream_use_cases(input_data['name'], enriched_context)),
+                    mimetype='application/x-ndjson'
+                )
+            
             # Generate use cases
-            results = expert_router.generate_use_cases(enriched_context)
+            results = services.expert_router.generate_use_cases(enriched_context)
             
             # Save routing log
             try:
-                expert_router.save_routing_log(results['routing_log'])
+                services.expert_router.save_routing_log(results['routing_log'])
             except Exception as e:
                 app.logger.warning(f"Failed to save routing log: {str(e)}")
             
@@ -136,17 +270,7 @@ def create_app(config_name='development'):
             response = {
                 "success": True,
                 "use_cases": results['use_cases'],
-                "routing_info": {
-                    "experts_used": len(results['routing_log']['selected_experts']),
-                    "selected_experts": [expert['name'] for expert in results['routing_log']['selected_experts']],
-                    "routing_strategy": results['routing_log']['routing_strategy']
-                },
-                "context_info": {
-                    "domain_classification": enriched_context.get('domain_classification', []),
-                    "strategic_alignment": enriched_context.get('strategic_alignment', 0.0),
-                    "content_richness": enriched_context.get('content_richness', 0.0)
-                },
-                "generation_timestamp": datetime.now().isoformat()
+                **use_case_summary(results['routing_log'], enriched_context)
             }
             
             app.logger.info(f"Generated {len(results['use_cases'])} use cases for dataset: {input_data['name']}")
@@ -171,13 +295,13 @@ def create_app(config_name='development'):
             
             # Analyze opportunities
             app.logger.info(f"Analyzing publishing opportunities for domain: {entity_scope.get('domain', 'unknown')}")
-            analysis_results = publisher.analyze_publishing_opportunities(entity_scope)
+            analysis_results = services.publisher.analyze_publishing_opportunities(entity_scope)
             
             # Generate publishing plan if recommendations exist
             publishing_plan = None
             if analysis_results['recommendations']:
                 entity_capacity = entity_scope.get('capacity', {"datasets_per_quarter": 2})
-                publishing_plan = publisher.generate_publishing_plan(
+                publishing_plan = services.publisher.generate_publishing_plan(
                     analysis_results['recommendations'], 
                     entity_capacity
                 )
@@ -186,7 +310,7 @@ def create_app(config_name='development'):
                 "success": True,
                 "analysis_results": analysis_results,
                 "publishing_plan": publishing_plan,
-                "analysis_timestamp": datetime.now().isoformat()
+                "analysis_timestamp": datetime.now()
             }
             
             app.logger.info(f"Generated {len(analysis_results['recommendations'])} publishing recommendations")
@@ -217,12 +341,12 @@ def create_app(config_name='development'):
             
             # Evaluate publishing impact
             app.logger.info(f"Evaluating dataset: {dataset_metadata.get('name', 'unknown')}")
-            evaluation_results = publisher.evaluate_publishing_impact(dataset_metadata, entity_scope)
+            evaluation_results = services.publisher.evaluate_publishing_impact(dataset_metadata, entity_scope)
             
             response = {
                 "success": True,
                 "evaluation": evaluation_results,
-                "evaluation_timestamp": datetime.now().isoformat()
+                "evaluation_timestamp": datetime.now()
             }
             
             return jsonify(response)
@@ -238,10 +362,10 @@ def create_app(config_name='development'):
     def data_status():
         """Get status of reference data files."""
         try:
-            status = data_loader.get_data_file_status()
+            status = services.data_loader.get_data_file_status()
             return jsonify({
                 "data_status": status,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now()
             })
         except Exception as e:
             app.logger.error(f"Error getting data status: {str(e)}")
@@ -251,7 +375,7 @@ def create_app(config_name='development'):
     def get_statistics():
         """Get system statistics and performance metrics."""
         try:
-            routing_stats = expert_router.get_routing_statistics()
+            routing_stats = services.expert_router.get_routing_statistics()
             
             statistics = {
                 "system_info": {
@@ -261,10 +385,10 @@ def create_app(config_name='development'):
                 },
                 "expert_system": routing_stats,
                 "data_loader": {
-                    "loaded_categories": len(data_loader.get_loaded_data()),
+                    "loaded_categories": len(services.data_loader.available_categories()),
                     "status": "active"
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": datetime.now()
             }
             
             return jsonify(statistics)
@@ -309,4 +433,5 @@ def setup_logging(app):
 if __name__ == '__main__':
     # Create and run the application
     app = create_app('development')
+    app.extensions['services'].warm()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
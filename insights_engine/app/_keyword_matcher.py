@@ -0,0 +1,89 @@
+"""
+Keyword Matcher - Finds every occurrence of a fixed keyword set in one regex scan
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+
+def build_keyword_matcher(keywords: Iterable[str]) -> Tuple[Pattern, Dict[str, List[str]]]:
+    """
+    Compile keywords into a single regex that finds every keyword occurring
+    anywhere in a text, in one scan.
+
+    The lookahead alternation (longest first) reports the longest keyword
+    starting at each position; the returned prefix map adds the shorter
+    keywords that start at the same position.
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    alternation = '|'.join(map(re.escape, ordered)) if ordered else '(?!)'
+    pattern = re.compile('(?=(' + alternation + '))')
+    prefixes = {
+        keyword: [other for other in ordered if other != keyword and keyword.startswith(other)]
+        for keyword in ordered
+    }
+    return pattern, prefixes
+
+
+def find_keywords(pattern: Pattern, prefixes: Dict[str, List[str]], text: str) -> Set[str]:
+    """Return the set of matcher keywords that occur as substrings of text."""
+    found = set()
+    for match in pattern.finditer(text):
+        keyword = match.group(1)
+        found.add(keyword)
+        found.update(prefixes[keyword])
+    return found
+
+
+def has_keywords(pattern: Pattern, prefixes: Dict[str, List[str]], text: str, count: int) -> bool:
+    """
+    Return whether at least count distinct matcher keywords occur in text,
+    stopping the scan as soon as they do.
+    """
+    if count <= 0:
+        return True
+    found = set()
+    for match in pattern.finditer(text):
+        keyword = match.group(1)
+        found.add(keyword)
+        found.update(prefixes[keyword])
+        if len(found) >= count:
+            return True
+    return False
+
+
+def best_rank(pattern: Pattern, prefixes: Dict[str, List[str]], ranks: Dict[str, int],
+              text: str) -> Optional[int]:
+    """
+    Return the lowest rank among the matcher keywords found in text, or None
+    when none occur. Stops scanning as soon as a rank 0 keyword is found.
+    """
+    best = None
+    for match in pattern.finditer(text):
+        keyword = match.group(1)
+        for found in (keyword, *prefixes[keyword]):
+            rank = ranks[found]
+            if best is None or rank < best:
+                if rank == 0:
+                    return 0
+                best = rank
+    return best
+
+
+def best_rank_in(pattern: Pattern, prefixes: Dict[str, List[str]], ranks: Dict[str, int],
+                 texts: Iterable[str]) -> Optional[int]:
+    """
+    Return the lowest rank among the matcher keywords found in any of texts,
+    or None when none occur.
+
+    Equivalent to best_rank() over the texts joined with spaces, provided no
+    keyword contains a space, without building the joined string.
+    """
+    best = None
+    for text in texts:
+        rank = best_rank(pattern, prefixes, ranks, text.lower())
+        if rank is not None and (best is None or rank < best):
+            if rank == 0:
+                return 0
+            best = rank
+    return best
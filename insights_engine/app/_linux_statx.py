@@ -0,0 +1,99 @@
+"""
+Linux statx() helper - Fetches only the file type, size and mtime for data files
+"""
+
+import ctypes
+import errno
+import os
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+
+AT_FDCWD = -100
+AT_STATX_DONT_SYNC = 0x4000
+STATX_TYPE = 0x0001
+STATX_MTIME = 0x0040
+STATX_SIZE = 0x0200
+
+StatxResult = namedtuple('StatxResult', ['st_mode', 'st_size', 'st_mtime_ns'])
+
+# Set when the kernel rejects statx() so later calls go straight to os.stat()
+_statx_unsupported = False
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("_reserved", ctypes.c_int32)
+    ]
+
+
+class _Statx(ctypes.Structure):
+    """Layout of struct statx from <linux/stat.h> (256 bytes)."""
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("_spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("_spare2", ctypes.c_uint64 * 14)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _statx_function():
+    """Look up libc's statx() once; None when the platform lacks it."""
+    if sys.platform != 'linux':
+        return None
+
+    try:
+        statx = ctypes.CDLL("libc.so.6", use_errno=True).statx
+    except (OSError, AttributeError):
+        return None
+
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                      ctypes.c_uint, ctypes.POINTER(_Statx)]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+def file_stat(path: str):
+    """
+    Return the mode, size and mtime of a file, using statx() with
+    AT_STATX_DONT_SYNC where available and os.stat() otherwise.
+    """
+    global _statx_unsupported
+    statx = None if _statx_unsupported else _statx_function()
+    if statx is None:
+        return os.stat(path)
+
+    buf = _Statx()
+    if statx(AT_FDCWD, os.fsencode(path), AT_STATX_DONT_SYNC,
+             STATX_TYPE | STATX_SIZE | STATX_MTIME, ctypes.byref(buf)) == 0:
+        mtime = buf.stx_mtime
+        return StatxResult(buf.stx_mode, buf.stx_size,
+                           mtime.tv_sec * 1_000_000_000 + mtime.tv_nsec)
+
+    err = ctypes.get_errno()
+    if err in (errno.ENOSYS, errno.EPERM):
+        # Old kernel or a seccomp filter blocking the syscall
+        _statx_unsupported = True
+        return os.stat(path)
+    raise OSError(err, os.strerror(err), path)
@@ -3,10 +3,113 @@ Context Engineering Engine - Processes and enriches dataset metadata for expert
 """
 
 from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+import copy
+import hashlib
 import re
 import logging
+import threading
 from datetime import datetime
 
+from ._keyword_matcher import build_keyword_matcher
+
+# Number of enriched contexts kept by ContextEngine.process_context
+CONTEXT_CACHE_SIZE = 1024
+
+# Upper bound on keywords extracted from a description
+MAX_EXTRACTED_KEYWORDS = 10
+
+# Patterns compiled once for text normalization and keyword extraction
+_NONWORD_RE = re.compile(r'[^\w\s\-\.]')
+_TECH_RE = re.compile(r'\b[a-z]+(?:_[a-z]+)*\b')
+
+# The ASCII characters _NONWORD_RE replaces, for the str.translate fast path
+_NONWORD_TABLE = str.maketrans({chr(c): ' ' for c in range(128) if _NONWORD_RE.match(chr(c))})
+
+# Domain-specific keywords for classification, in extraction order
+_DOMAIN_KEYWORDS = {
+    "energy": (
+        "energy", "renewable", "solar", "wind", "hydroelectric", "nuclear",
+        "electricity", "power", "grid", "consumption", "efficiency", "carbon",
+        "fuel", "oil", "gas", "coal", "biomass", "geothermal"
+    ),
+    "healthcare": (
+        "health", "medical", "hospital", "patient", "disease", "treatment",
+        "medicine", "clinical", "healthcare", "wellness", "epidemiology",
+        "pharmacy", "surgery", "diagnosis", "therapy"
+    ),
+    "transportation": (
+        "transport", "traffic", "vehicle", "road", "railway", "aviation",
+        "shipping", "logistics", "mobility", "infrastructure", "transit",
+        "automotive", "public transport", "freight"
+    ),
+    "education": (
+        "education", "school", "university", "student", "teacher", "learning",
+        "curriculum", "academic", "training", "knowledge", "skill", "literacy"
+    ),
+    "environment": (
+        "environment", "climate", "weather", "pollution", "ecosystem",
+        "biodiversity", "conservation", "sustainability", "green", "clean"
+    ),
+    "economic": (
+        "economy", "finance", "business", "trade", "industry", "commerce",
+        "investment", "market", "economic", "financial", "banking", "gdp"
+    ),
+    "social": (
+        "social", "community", "population", "demographic", "welfare",
+        "housing", "employment", "poverty", "inequality", "development"
+    )
+}
+
+# Keywords related to national strategic objectives
+_STRATEGIC_KEYWORDS = (
+    "vision 2030", "digital transformation", "smart city", "innovation",
+    "sustainability", "diversification", "renewable energy", "efficiency",
+    "transparency", "governance", "public service", "economic growth",
+    "social development", "infrastructure", "technology", "artificial intelligence",
+    "automation", "green initiative", "carbon neutral", "climate change"
+)
+
+# Domains whose datasets get a strategic alignment boost
+_HIGH_PRIORITY_DOMAINS = frozenset({"energy", "healthcare", "education", "transportation"})
+
+# Keywords that mark government focus areas
+_FOCUS_AREA_KEYWORDS = {
+    "digital_transformation": frozenset({"digital", "technology", "automation", "ai", "artificial intelligence", "smart"}),
+    "sustainability": frozenset({"renewable", "green", "sustainable", "environment", "carbon", "climate"}),
+    "economic_diversification": frozenset({"economy", "business", "industry", "manufacturing", "commerce"}),
+    "social_development": frozenset({"social", "community", "welfare", "development", "quality of life"}),
+    "infrastructure": frozenset({"infrastructure", "construction", "transport", "utilities", "telecommunications"}),
+    "innovation": frozenset({"innovation", "research", "development", "technology", "startup"}),
+    "transparency": frozenset({"transparency", "open", "public", "accountability", "governance"})
+}
+
+
+# Matcher over domain, strategic and focus area keywords, built once at import
+# and shared by every ContextEngine (and by forked workers, copy-on-write)
+_KEYWORD_PATTERN, _KEYWORD_PREFIXES = build_keyword_matcher(
+    [kw for keywords in _DOMAIN_KEYWORDS.values() for kw in keywords]
+    + list(_STRATEGIC_KEYWORDS)
+    + [kw for keywords in _FOCUS_AREA_KEYWORDS.values() for kw in keywords]
+)
+
+# Domains each domain keyword counts towards
+_KEYWORD_DOMAINS = {
+    keyword: tuple(domain for domain, domain_keywords in _DOMAIN_KEYWORDS.items() if keyword in domain_keywords)
+    for keywords in _DOMAIN_KEYWORDS.values()
+    for keyword in keywords
+}
+
+# Domain keywords in extraction order, without repeats
+_ORDERED_DOMAIN_KEYWORDS = tuple(_KEYWORD_DOMAINS)
+
+# Focus areas each focus keyword marks
+_KEYWORD_FOCUS_AREAS = {
+    keyword: tuple(area for area, area_keywords in _FOCUS_AREA_KEYWORDS.items() if keyword in area_keywords)
+    for keywords in _FOCUS_AREA_KEYWORDS.values()
+    for keyword in keywords
+}
+
 
 class ContextEngine:
     """
@@ -16,8 +119,17 @@ class ContextEngine:
     
     def __init__(self):
         self.logger = logging.getLogger('context_engine')
-        self.domain_keywords = self._load_domain_keywords()
-        self.strategic_keywords = self._load_strategic_keywords()
+        self.domain_keywords = _DOMAIN_KEYWORDS
+        self.strategic_keywords = _STRATEGIC_KEYWORDS
+        self.focus_area_keywords = _FOCUS_AREA_KEYWORDS
+        self._keyword_pattern = _KEYWORD_PATTERN
+        self._keyword_prefixes = _KEYWORD_PREFIXES
+        self._keyword_domains = _KEYWORD_DOMAINS
+        self._ordered_domain_keywords = _ORDERED_DOMAIN_KEYWORDS
+        
+        # Enriched contexts by metadata hash, least recently used first
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def process_context(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -32,11 +144,47 @@ class ContextEngine:
         Returns:
             Enriched context dictionary
         """
+        timestamp = datetime.now().isoformat()
+        key = self._cache_key(metadata)
+        
+        # Processing is deterministic, so repeated metadata reuses the cached result
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            context = copy.deepcopy(cached)
+            context["processing_timestamp"] = timestamp
+            context["processing_metadata"]["processing_timestamp"] = timestamp
+            self.logger.info(f"Processed context for dataset: {context['name']} (cached)")
+            return context
+        
+        context = self._build_context(metadata, timestamp)
+        
+        with self._cache_lock:
+            self._cache[key] = copy.deepcopy(context)
+            if len(self._cache) > CONTEXT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        
+        return context
+    
+    def clear_cache(self):
+        """Drop all cached contexts."""
+        with self._cache_lock:
+            self._cache.clear()
+    
+    def _cache_key(self, metadata: Dict[str, Any]) -> bytes:
+        """Hash the metadata fields that process_context reads."""
+        fields = (metadata.get("name", ""), metadata.get("description", ""), metadata.get("keywords", []))
+        return hashlib.blake2b(repr(fields).encode('utf-8'), digest_size=16).digest()
+    
+    def _build_context(self, metadata: Dict[str, Any], timestamp: str) -> Dict[str, Any]:
+        """Run the full enrichment pipeline for process_context."""
         context = {
             "name": metadata.get("name", ""),
             "description": metadata.get("description", ""),
             "keywords": metadata.get("keywords", []),
-            "processing_timestamp": datetime.now().isoformat()
+            "processing_timestamp": timestamp
         }
         
         # Clean and normalize text
@@ -44,17 +192,20 @@ class ContextEngine:
         context["normalized_description"] = self._normalize_text(context["description"])
         context["normalized_keywords"] = [self._normalize_text(kw) for kw in context["keywords"]]
         
+        # Find all known keywords in one pass over the text
+        hits = self._scan_text(context)
+        
         # Extract additional keywords from description
-        context["extracted_keywords"] = self._extract_keywords(context["description"])
+        context["extracted_keywords"] = self._extract_keywords(context["normalized_description"], hits["description"])
         
         # Classify domain(s)
-        context["domain_classification"] = self._classify_domains(context)
+        context["domain_classification"] = self._classify_domains(hits["all"])
         
         # Assess strategic alignment
-        context["strategic_alignment"] = self._assess_strategic_alignment(context)
+        context["strategic_alignment"] = self._assess_strategic_alignment(context, hits["all"])
         
         # Identify government focus areas
-        context["government_focus_areas"] = self._identify_focus_areas(context)
+        context["government_focus_areas"] = self._identify_focus_areas(hits["name_description"])
         
         # Calculate content richness
         context["content_richness"] = self._calculate_content_richness(context)
@@ -74,54 +225,74 @@ class ContextEngine:
         if not text:
             return ""
         
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Convert to lowercase and remove extra whitespace
+        text = ' '.join(text.lower().split())
         
-        # Remove special characters but keep alphanumeric and basic punctuation
-        text = re.sub(r'[^\w\s\-\.]', ' ', text)
+        # Remove special characters but keep alphanumeric and basic punctuation;
+        # the translate table covers ASCII, Unicode word characters need the regex
+        if text.isascii():
+            return text.translate(_NONWORD_TABLE)
+        return _NONWORD_RE.sub(' ', text)
+    
+    def _scan_text(self, context: Dict[str, Any]) -> Dict[str, set]:
+        """
+        Scan the normalized name, description and keywords once.
         
-        return text
+        Returns the known keywords found in the whole text ("all"), in the
+        name and description ("name_description"), and in the description
+        alone ("description").
+        """
+        name = context["normalized_name"]
+        description = context["normalized_description"]
+        # One join straight from the parts; no intermediate keyword string
+        text_content = ' '.join((name, description, *context['normalized_keywords']))
+        
+        description_start = len(name) + 1
+        description_end = description_start + len(description)
+        hits = {"all": set(), "name_description": set(), "description": set()}
+        
+        for match in self._keyword_pattern.finditer(text_content):
+            start = match.start()
+            keyword = match.group(1)
+            for found in (keyword, *self._keyword_prefixes[keyword]):
+                hits["all"].add(found)
+                if start + len(found) <= description_end:
+                    hits["name_description"].add(found)
+                    if start >= description_start:
+                        hits["description"].add(found)
+        
+        return hits
     
-    def _extract_keywords(self, description: str) -> List[str]:
-        """Extract relevant keywords from description."""
-        if not description:
+    def _extract_keywords(self, normalized_desc: str, found: set) -> List[str]:
+        """Extract relevant keywords from the normalized description."""
+        if not normalized_desc:
             return []
         
         # Simple keyword extraction based on domain knowledge
-        extracted = []
-        normalized_desc = self._normalize_text(description)
-        
-        # Check against domain keywords
-        for domain, keywords in self.domain_keywords.items():
-            for keyword in keywords:
-                if keyword in normalized_desc and keyword not in extracted:
-                    extracted.append(keyword)
-        
-        # Extract potential technical terms (words with specific patterns)
-        technical_terms = re.findall(r'\b[a-z]+(?:_[a-z]+)*\b', normalized_desc)
-        for term in technical_terms:
-            if len(term) > 3 and term not in extracted:
+        extracted = [keyword for keyword in self._ordered_domain_keywords if keyword in found]
+        if len(extracted) >= MAX_EXTRACTED_KEYWORDS:
+            return extracted[:MAX_EXTRACTED_KEYWORDS]
+        
+        # Extract potential technical terms (words with specific patterns),
+        # scanning lazily so long descriptions stop once the limit is reached
+        seen = set(extracted)
+        for match in _TECH_RE.finditer(normalized_desc):
+            term = match.group()
+            if len(term) > 3 and term not in seen:
+                seen.add(term)
                 extracted.append(term)
+                if len(extracted) >= MAX_EXTRACTED_KEYWORDS:
+                    break
         
-        return extracted[:10]  # Limit to top 10 extracted keywords
+        return extracted
     
-    def _classify_domains(self, context: Dict[str, Any]) -> List[str]:
+    def _classify_domains(self, found: set) -> List[str]:
         """Classify the dataset into relevant domains."""
-        text_content = f"{context['normalized_name']} {context['normalized_description']} {' '.join(context['normalized_keywords'])}"
-        
-        domain_scores = {}
+        domain_scores = dict.fromkeys(self.domain_keywords, 0)
         
-        for domain, keywords in self.domain_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword in text_content:
-                    score += 1
-            
-            if score > 0:
-                domain_scores[domain] = score
+        for keyword in found:
+            for domain in self._keyword_domains.get(keyword, ()):
+                domain_scores[domain] += 1
         
         # Return domains with scores above threshold
         threshold = 1
@@ -129,10 +300,8 @@ class ContextEngine:
         
         return classified_domains if classified_domains else ["general"]
     
-    def _assess_strategic_alignment(self, context: Dict[str, Any]) -> float:
+    def _assess_strategic_alignment(self, context: Dict[str, Any], found: set) -> float:
         """Assess alignment with national strategic objectives."""
-        text_content = f"{context['normalized_name']} {context['normalized_description']} {' '.join(context['normalized_keywords'])}"
-        
         alignment_score = 0.0
         total_strategic_keywords = len(self.strategic_keywords)
         
@@ -140,39 +309,22 @@ class ContextEngine:
             return 0.5  # Default neutral score
         
         for keyword in self.strategic_keywords:
-            if keyword in text_content:
+            if keyword in found:
                 alignment_score += 1.0
         
         # Normalize score to 0-1 range
         normalized_score = min(1.0, alignment_score / (total_strategic_keywords * 0.3))
         
         # Boost score for high-priority domains
-        high_priority_domains = ["energy", "healthcare", "education", "transportation"]
-        domain_boost = 0.1 if any(domain in context.get("domain_classification", []) 
-                                 for domain in high_priority_domains) else 0.0
+        domain_boost = 0.1 if not _HIGH_PRIORITY_DOMAINS.isdisjoint(context.get("domain_classification", ())) else 0.0
         
         return min(1.0, normalized_score + domain_boost)
     
-    def _identify_focus_areas(self, context: Dict[str, Any]) -> List[str]:
+    def _identify_focus_areas(self, found: set) -> List[str]:
         """Identify government focus areas relevant to the dataset."""
-        focus_areas = []
-        text_content = f"{context['normalized_name']} {context['normalized_description']}".lower()
-        
-        focus_area_keywords = {
-            "digital_transformation": ["digital", "technology", "automation", "ai", "artificial intelligence", "smart"],
-            "sustainability": ["renewable", "green", "sustainable", "environment", "carbon", "climate"],
-            "economic_diversification": ["economy", "business", "industry", "manufacturing", "commerce"],
-            "social_development": ["social", "community", "welfare", "development", "quality of life"],
-            "infrastructure": ["infrastructure", "construction", "transport", "utilities", "telecommunications"],
-            "innovation": ["innovation", "research", "development", "technology", "startup"],
-            "transparency": ["transparency", "open", "public", "accountability", "governance"]
-        }
-        
-        for area, keywords in focus_area_keywords.items():
-            if any(keyword in text_content for keyword in keywords):
-                focus_areas.append(area)
-        
-        return focus_areas
+        # Map the scan hits straight to areas, then report them in table order
+        matched = {area for keyword in found for area in _KEYWORD_FOCUS_AREAS.get(keyword, ())}
+        return [area for area in self.focus_area_keywords if area in matched]
     
     def _calculate_content_richness(self, context: Dict[str, Any]) -> float:
         """Calculate the richness of the dataset content."""
@@ -237,52 +389,6 @@ class ContextEngine:
         # Calculate weighted average
         return sum(factors) / len(factors)
     
-    def _load_domain_keywords(self) -> Dict[str, List[str]]:
-        """Load domain-specific keywords for classification."""
-        return {
-            "energy": [
-                "energy", "renewable", "solar", "wind", "hydroelectric", "nuclear",
-                "electricity", "power", "grid", "consumption", "efficiency", "carbon",
-                "fuel", "oil", "gas", "coal", "biomass", "geothermal"
-            ],
-            "healthcare": [
-                "health", "medical", "hospital", "patient", "disease", "treatment",
-                "medicine", "clinical", "healthcare", "wellness", "epidemiology",
-                "pharmacy", "surgery", "diagnosis", "therapy"
-            ],
-            "transportation": [
-                "transport", "traffic", "vehicle", "road", "railway", "aviation",
-                "shipping", "logistics", "mobility", "infrastructure", "transit",
-                "automotive", "public transport", "freight"
-            ],
-            "education": [
-                "education", "school", "university", "student", "teacher", "learning",
-                "curriculum", "academic", "training", "knowledge", "skill", "literacy"
-            ],
-            "environment": [
-                "environment", "climate", "weather", "pollution", "ecosystem",
-                "biodiversity", "conservation", "sustainability", "green", "clean"
-            ],
-            "economic": [
-                "economy", "finance", "business", "trade", "industry", "commerce",
-                "investment", "market", "economic", "financial", "banking", "gdp"
-            ],
-            "social": [
-                "social", "community", "population", "demographic", "welfare",
-                "housing", "employment", "poverty", "inequality", "development"
-            ]
-        }
-    
-    def _load_strategic_keywords(self) -> List[str]:
-        """Load keywords related to national strategic objectives."""
-        return [
-            "vision 2030", "digital transformation", "smart city", "innovation",
-            "sustainability", "diversification", "renewable energy", "efficiency",
-            "transparency", "governance", "public service", "economic growth",
-            "social development", "infrastructure", "technology", "artificial intelligence",
-            "automation", "green initiative", "carbon neutral", "climate change"
-        ]
-    
     def validate_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate the processed context and return validation results.
@@ -2,11 +2,222 @@
 Data Loader - Loads and manages reference data files for the Insights Engine
 """
 
-import json
+import asyncio
+import mmap
+from array import array
 import os
-from typing import Dict, Any, List, Optional
+from pathlib import Path
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Mapping as MappingABC
+from typing import Dict, Any, Callable, Iterator, List, Mapping, Optional, Tuple
 import logging
 
+import orjson
+
+try:
+    import ijson
+except ImportError:  # fall back to parsing the whole file with orjson
+    ijson = None
+
+from ._linux_statx import file_stat
+
+
+# Shared read-only result for unknown or empty categories
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Read reference files through a 64KB buffer; large templates need fewer read() calls
+_READ_BUFFER_SIZE = 64 * 1024
+# Files above this size are memory-mapped and decoded in place instead of read()
+_MMAP_THRESHOLD = 64 * 1024
+
+# O_NOATIME skips access-time updates on reads; it is Linux-only and owner-only
+_READ_FLAGS = os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+_NOATIME = getattr(os, 'O_NOATIME', 0)
+_WRITE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+
+
+def _open_ro(path: Path):
+    """Open a file for buffered binary reading without updating its atime."""
+    try:
+        fd = os.open(path, _READ_FLAGS | _NOATIME)
+    except PermissionError:
+        if not _NOATIME:
+            raise
+        # O_NOATIME needs file ownership or CAP_FOWNER
+        fd = os.open(path, _READ_FLAGS)
+    return os.fdopen(fd, 'rb', buffering=_READ_BUFFER_SIZE)
+
+
+def _decode_text(data) -> str:
+    """Decode UTF-8 file bytes with universal newlines, as text-mode open() does."""
+    return str(data, 'utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _dumps(content: Any) -> bytes:
+    """Serialize data files as indented UTF-8 JSON."""
+    return orjson.dumps(content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
+def _kvitems(node: Any, path: List[str]) -> Iterator[Tuple[str, Any]]:
+    """Resolve an ijson-style prefix against parsed JSON and yield key/value pairs."""
+    if not path:
+        if isinstance(node, dict):
+            yield from node.items()
+        return
+    
+    head, rest = path[0], path[1:]
+    if head == 'item' and isinstance(node, list):
+        for item in node:
+            yield from _kvitems(item, rest)
+    elif isinstance(node, dict) and head in node:
+        yield from _kvitems(node[head], rest)
+
+
+# Contents written by create_sample_data_files() when the reference files are absent
+_SAMPLE_FILES: Dict[str, Any] = {
+    "06_Domain_Keyword_Mapping.json": {
+        "energy": ["renewable", "solar", "wind", "efficiency", "grid", "power"],
+        "transportation": ["traffic", "mobility", "vehicle", "transit", "logistics"],
+        "healthcare": ["medical", "health", "hospital", "patient", "treatment"],
+        "education": ["school", "university", "student", "learning", "academic"],
+        "environment": ["climate", "pollution", "conservation", "sustainability"],
+        "economic": ["economy", "finance", "trade", "business", "investment"]
+    },
+    "05_Example_Input_Metadata.json": {
+        "name": "Renewable Energy Production Statistics",
+        "description": "Monthly statistics of renewable energy production across Saudi Arabia including solar, wind, and other clean energy sources.",
+        "keywords": ["renewable energy", "solar power", "wind energy", "clean energy", "sustainability"]
+    },
+    "12_Routing_Log_Format.json": {
+        "timestamp": "ISO datetime",
+        "dataset_name": "string",
+        "routing_decisions": [
+            {
+                "expert_name": "string",
+                "expert_domain": "string",
+                "can_handle": "boolean",
+                "alignment_score": "float",
+                "decision_timestamp": "ISO datetime"
+            }
+        ],
+        "selected_experts": [
+            {
+                "name": "string",
+                "domain": "string",
+                "capabilities": ["array of strings"]
+            }
+        ],
+        "routing_strategy": "string"
+    }
+}
+
+# Serialized once at import; the sample contents never change
+_SAMPLE_FILE_BYTES: Dict[str, bytes] = {
+    filename: _dumps(content) for filename, content in _SAMPLE_FILES.items()
+}
+
+
+# Reference files per category as (key, filename, is_json)
+_REFERENCE_FILES: Dict[str, Tuple[Tuple[str, str, bool], ...]] = {
+    "expert_configurations": (
+        ("expert_roles_and_responsibilities", "01_Expert_Roles_and_Responsibilities.txt", False),
+        ("expert_capabilities", "02_Expert_Capabilities.txt", False)
+    ),
+    "strategic_framework": (
+        ("strategic_framework", "03_Strategy_and_Objectives.txt", False),
+    ),
+    "templates": (
+        ("usecasetemplate", "04_UseCase_Template.txt", False),
+        ("prompttemplateforllm", "11_Prompt_Template_for_LLM.txt", False)
+    ),
+    "domain_mappings": (
+        ("domain_keywords", "06_Domain_Keyword_Mapping.json", True),
+        ("classification_rules", "07_Dataset_Classification_Rules.txt", False)
+    ),
+    "workflow_configurations": (
+        ("contextengineeringworkflow", "09_Context_Engineering_Workflow.txt", False),
+        ("routerworkflowandlogic", "10_Router_Workflow_and_Logic.txt", False),
+        ("publishingstrategyrouting", "03_Publishing_Strategy_Routing.txt", False)
+    ),
+    "log_formats": (
+        ("routinglogformat", "12_Routing_Log_Format.json", True),
+        ("outputauditlogformat", "13_Output_Audit_Log_Format.json", True),
+        ("publishingoutputlogformat", "06_Publishing_Output_Log_Format.json", True)
+    ),
+    "publishing_configurations": (
+        ("modeloverviewopendata", "00_Model_Overview_OpenData.txt", False),
+        ("publishingrecommendationtemplate", "01_Publishing_Recommendation_Template.txt", False),
+        ("publishingevaluationcriteria", "02_Publishing_Evaluation_Criteria.txt", False),
+        ("publishingmatchinglogic", "04_Publishing_Matching_Logic.txt", False)
+    ),
+    "example_data": (
+        ("exampleinputmetadata", "05_Example_Input_Metadata.json", True),
+        ("examplerecommendationinput", "05_Example_Recommendation_Input.json", True)
+    )
+}
+
+
+# Files reported by get_data_file_status(), by type
+_EXPECTED_FILES: Dict[str, Tuple[str, ...]] = {
+    "text_files": (
+        "00_Model_Overview.txt",
+        "01_Expert_Roles_and_Responsibilities.txt",
+        "02_Expert_Capabilities.txt",
+        "03_Strategy_and_Objectives.txt",
+        "04_UseCase_Template.txt",
+        "07_Dataset_Classification_Rules.txt",
+        "08_Contextual_Constraints.txt",
+        "09_Context_Engineering_Workflow.txt",
+        "10_Router_Workflow_and_Logic.txt",
+        "11_Prompt_Template_for_LLM.txt",
+        "00_Model_Overview_OpenData.txt",
+        "01_Publishing_Recommendation_Template.txt",
+        "02_Publishing_Evaluation_Criteria.txt",
+        "03_Publishing_Strategy_Routing.txt",
+        "04_Publishing_Matching_Logic.txt"
+    ),
+    "json_files": (
+        "05_Example_Input_Metadata.json",
+        "06_Domain_Keyword_Mapping.json",
+        "12_Routing_Log_Format.json",
+        "13_Output_Audit_Log_Format.json",
+        "05_Example_Recommendation_Input.json",
+        "06_Publishing_Output_Log_Format.json"
+    )
+}
+
+# The same files as parallel name/type columns
+_EXPECTED_NAMES = tuple(name for files in _EXPECTED_FILES.values() for name in files)
+_EXPECTED_TYPES = tuple(file_type for file_type, files in _EXPECTED_FILES.items() for _ in files)
+
+
+class _LazyReferenceData(MappingABC):
+    """
+    Read-only category -> data view over a DataLoader, as returned by
+    load_all_reference_data(). Looking up a category reads only that
+    category; iterating or taking len() reads them all. Empty categories
+    are left out, as with get_loaded_data().
+    """
+    
+    __slots__ = ("_loader",)
+    
+    def __init__(self, loader: "DataLoader"):
+        self._loader = loader
+    
+    def __getitem__(self, category: str) -> Mapping[str, Any]:
+        data = self._loader._load_category(category)
+        if not data:
+            raise KeyError(category)
+        return data
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._loader.get_loaded_data())
+    
+    def __len__(self) -> int:
+        return len(self._loader.get_loaded_data())
+
 
 class DataLoader:
     """
@@ -16,354 +227,373 @@ class DataLoader:
     
     def __init__(self, data_dir: str = "data"):
         self.data_dir = data_dir
+        self._data_path = Path(data_dir)
+        self._path_cache: Dict[str, Path] = {}
         self.logger = logging.getLogger('data_loader')
         self._loaded_data = {}
+        # Stat results (mode, size, mtime) for the data directory, filled by one scandir pass
+        self._dir_index: Optional[Dict[str, Any]] = None
+        # Parsed file contents keyed by filename as (mtime_ns, size, content)
+        self._file_cache: Dict[str, Tuple[int, int, Any]] = {}
+        
+        # Categories are read from disk on first access via get_loaded_data()
+        self._loader_registry: Dict[str, Callable[[], Dict[str, Any]]] = {
+            "expert_configurations": self.load_expert_configurations,
+            "strategic_framework": self.load_strategic_framework,
+            "templates": self.load_templates,
+            "domain_mappings": self.load_domain_mappings,
+            "workflow_configurations": self.load_workflow_configurations,
+            "log_formats": self.load_log_formats,
+            "publishing_configurations": self.load_publishing_configurations,
+            "example_data": self.load_example_data
+        }
         
         # Create data directory if it doesn't exist
         os.makedirs(data_dir, exist_ok=True)
     
     def load_expert_configurations(self) -> Dict[str, Any]:
         """Load expert roles, responsibilities, and capabilities."""
-        config_files = [
-            "01_Expert_Roles_and_Responsibilities.txt",
-            "02_Expert_Capabilities.txt"
-        ]
-        
-        configurations = {}
-        for filename in config_files:
-            try:
-                content = self._load_text_file(filename)
-                if content:
-                    key = filename.split('_', 1)[1].replace('.txt', '').lower()
-                    configurations[key] = content
-            except Exception as e:
-                self.logger.warning(f"Could not load {filename}: {str(e)}")
-        
-        return configurations
+        return self._read_category("expert_configurations")
     
     def load_strategic_framework(self) -> Dict[str, Any]:
         """Load strategy and objectives framework."""
-        try:
-            content = self._load_text_file("03_Strategy_and_Objectives.txt")
-            return {"strategic_framework": content} if content else {}
-        except Exception as e:
-            self.logger.warning(f"Could not load strategic framework: {str(e)}")
-            return {}
+        return self._read_category("strategic_framework")
     
     def load_templates(self) -> Dict[str, Any]:
         """Load use case and output templates."""
-        templates = {}
-        
-        template_files = [
-            "04_UseCase_Template.txt",
-            "11_Prompt_Template_for_LLM.txt"
-        ]
-        
-        for filename in template_files:
-            try:
-                content = self._load_text_file(filename)
-                if content:
-                    key = filename.split('_', 1)[1].replace('.txt', '').replace('_', '').lower()
-                    templates[key] = content
-            except Exception as e:
-                self.logger.warning(f"Could not load template {filename}: {str(e)}")
-        
-        return templates
+        return self._read_category("templates")
     
     def load_domain_mappings(self) -> Dict[str, Any]:
         """Load domain keyword mappings and classification rules."""
-        mappings = {}
-        
-        try:
-            # Load domain keyword mapping
-            domain_keywords = self._load_json_file("06_Domain_Keyword_Mapping.json")
-            if domain_keywords:
-                mappings["domain_keywords"] = domain_keywords
-        except Exception as e:
-            self.logger.warning(f"Could not load domain keywords: {str(e)}")
-        
-        try:
-            # Load classification rules
-            classification_rules = self._load_text_file("07_Dataset_Classification_Rules.txt")
-            if classification_rules:
-                mappings["classification_rules"] = classification_rules
-        except Exception as e:
-            self.logger.warning(f"Could not load classification rules: {str(e)}")
-        
-        return mappings
+        return self._read_category("domain_mappings")
     
     def load_workflow_configurations(self) -> Dict[str, Any]:
         """Load workflow and routing configurations."""
-        workflows = {}
-        
-        workflow_files = [
-            "09_Context_Engineering_Workflow.txt",
-            "10_Router_Workflow_and_Logic.txt",
-            "03_Publishing_Strategy_Routing.txt"
-        ]
-        
-        for filename in workflow_files:
-            try:
-                content = self._load_text_file(filename)
-                if content:
-                    key = filename.split('_', 1)[1].replace('.txt', '').replace('_', '').lower()
-                    workflows[key] = content
-            except Exception as e:
-                self.logger.warning(f"Could not load workflow {filename}: {str(e)}")
-        
-        return workflows
+        return self._read_category("workflow_configurations")
     
     def load_log_formats(self) -> Dict[str, Any]:
         """Load log format templates."""
-        log_formats = {}
-        
-        log_format_files = [
-            "12_Routing_Log_Format.json",
-            "13_Output_Audit_Log_Format.json",
-            "06_Publishing_Output_Log_Format.json"
-        ]
-        
-        for filename in log_format_files:
-            try:
-                content = self._load_json_file(filename)
-                if content:
-                    key = filename.split('_', 1)[1].replace('.json', '').replace('_', '').lower()
-                    log_formats[key] = content
-            except Exception as e:
-                self.logger.warning(f"Could not load log format {filename}: {str(e)}")
-        
-        return log_formats
+        return self._read_category("log_formats")
     
     def load_publishing_configurations(self) -> Dict[str, Any]:
         """Load open data publishing configurations."""
-        publishing_config = {}
-        
-        publishing_files = [
-            "00_Model_Overview_OpenData.txt",
-            "01_Publishing_Recommendation_Template.txt",
-            "02_Publishing_Evaluation_Criteria.txt",
-            "04_Publishing_Matching_Logic.txt"
-        ]
-        
-        for filename in publishing_files:
-            try:
-                content = self._load_text_file(filename)
-                if content:
-                    key = filename.split('_', 1)[1].replace('.txt', '').replace('_', '').lower()
-                    publishing_config[key] = content
-            except Exception as e:
-                self.logger.warning(f"Could not load publishing config {filename}: {str(e)}")
-        
-        return publishing_config
+        return self._read_category("publishing_configurations")
     
     def load_example_data(self) -> Dict[str, Any]:
         """Load example inputs and outputs."""
-        examples = {}
-        
-        example_files = [
-            "05_Example_Input_Metadata.json",
-            "05_Example_Recommendation_Input.json"
-        ]
+        return self._read_category("example_data")
+    
+    def index(self) -> List[str]:
+        """List the files in the data directory without reading them."""
+        return sorted(self._refresh_index())
+    
+    def load_all_reference_data(self) -> Mapping[str, Any]:
+        """
+        Load all reference data files.
         
-        for filename in example_files:
-            try:
-                content = self._load_json_file(filename)
-                if content:
-                    key = filename.split('_', 1)[1].replace('.json', '').replace('_', '').lower()
-                    examples[key] = content
-            except Exception as e:
-                self.logger.warning(f"Could not load example {filename}: {str(e)}")
+        Re-indexes the data directory and returns a mapping of category to
+        data; each category is read from disk on first access.
+        """
+        self._loaded_data = {}
+        self.index()
+        return _LazyReferenceData(self)
+    
+    def available_categories(self) -> List[str]:
+        """List the categories with at least one file in the data directory, without reading any."""
+        dir_index = self._get_dir_index()
+        return [category for category, files in _REFERENCE_FILES.items()
+                if any(filename in dir_index for _, filename, _ in files)]
+    
+    def get_loaded_data(self, category: Optional[str] = None) -> Mapping[str, Any]:
+        """Get loaded data by category or all data, loading it on first access."""
+        if category:
+            return self._load_category(category)
         
-        return examples
+        pending = [key for key in self._loader_registry if key not in self._loaded_data]
+        if pending:
+            self._load_categories_concurrently(pending)
+        return {key: self._loaded_data[key] for key in self._loader_registry
+                if self._loaded_data[key]}
     
-    def load_all_reference_data(self) -> Dict[str, Any]:
-        """Load all reference data files."""
-        all_data = {}
+    def _load_category(self, category: str) -> Mapping[str, Any]:
+        """Run the registered loader for a category once and cache the result."""
+        if category in self._loaded_data:
+            return self._loaded_data[category]
         
-        loaders = [
-            ("expert_configurations", self.load_expert_configurations),
-            ("strategic_framework", self.load_strategic_framework),
-            ("templates", self.load_templates),
-            ("domain_mappings", self.load_domain_mappings),
-            ("workflow_configurations", self.load_workflow_configurations),
-            ("log_formats", self.load_log_formats),
-            ("publishing_configurations", self.load_publishing_configurations),
-            ("example_data", self.load_example_data)
-        ]
+        loader_func = self._loader_registry.get(category)
+        if loader_func is None:
+            return _EMPTY
         
-        for key, loader_func in loaders:
-            try:
-                data = loader_func()
-                if data:
-                    all_data[key] = data
-                    self.logger.info(f"Loaded {key}: {len(data)} items")
-            except Exception as e:
-                self.logger.error(f"Failed to load {key}: {str(e)}")
+        return self._store_category(category, loader_func())
+    
+    async def aload_all_reference_data(self) -> Dict[str, Any]:
+        """
+        Async variant of get_loaded_data() for event-loop callers: every
+        pending file is read in a worker thread and awaited together.
+        """
+        pending = [key for key in self._loader_registry if key not in self._loaded_data]
+        if pending:
+            loop = asyncio.get_running_loop()
+            jobs = await loop.run_in_executor(None, self._reference_jobs, pending)
+            contents = await asyncio.gather(
+                *(loop.run_in_executor(None, self._read_file, filename, is_json)
+                  for _, _, filename, is_json in jobs)
+            )
+            self._store_results(pending, jobs, contents)
+        return self.get_loaded_data()
+    
+    def _load_categories_concurrently(self, categories: List[str]):
+        """Read the files of several categories on a thread pool and cache them."""
+        jobs = self._reference_jobs(categories)
         
-        self._loaded_data = all_data
-        return all_data
+        contents = []
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+                contents = list(executor.map(lambda job: self._read_file(job[2], job[3]), jobs))
+        
+        self._store_results(categories, jobs, contents)
     
-    def get_loaded_data(self, category: Optional[str] = None) -> Dict[str, Any]:
-        """Get loaded data by category or all data."""
-        if category:
-            return self._loaded_data.get(category, {})
-        return self._loaded_data
+    def _reference_jobs(self, categories: List[str]) -> List[Tuple[str, str, str, bool]]:
+        """List (category, key, filename, is_json) for the files of categories that exist."""
+        # Only files present in the directory index are handed to the workers
+        dir_index = self._get_dir_index()
+        return [(category, key, filename, is_json)
+                for category in categories
+                for key, filename, is_json in _REFERENCE_FILES[category]
+                if filename in dir_index]
+    
+    def _store_results(self, categories: List[str], jobs: List[Tuple[str, str, str, bool]],
+                       contents: List[Any]):
+        """Bucket file contents back into their categories and cache them."""
+        results = {category: {} for category in categories}
+        for (category, key, _, _), content in zip(jobs, contents):
+            if content:
+                results[category][key] = content
+        
+        for category, data in results.items():
+            self._store_category(category, data)
+    
+    def _store_category(self, category: str, data: Dict[str, Any]) -> Mapping[str, Any]:
+        """Cache a loaded category; empty ones share the read-only _EMPTY mapping."""
+        if data:
+            self.logger.info("Loaded %s: %d items", category, len(data))
+        else:
+            data = _EMPTY
+        self._loaded_data[category] = data
+        return data
+    
+    def _read_category(self, category: str) -> Dict[str, Any]:
+        """Read every file of a category, keyed by its reference data key."""
+        data = {}
+        dir_index = self._get_dir_index()
+        for key, filename, is_json in _REFERENCE_FILES[category]:
+            if filename not in dir_index:
+                continue
+            content = self._read_file(filename, is_json)
+            if content:
+                data[key] = content
+        return data
+    
+    def _read_file(self, filename: str, is_json: bool) -> Any:
+        """Load a text or JSON reference file."""
+        if is_json:
+            return self._load_json_file(filename)
+        return self._load_text_file(filename)
     
     def create_sample_data_files(self):
         """Create sample data files for testing when reference files are not available."""
-        sample_files = {
-            "06_Domain_Keyword_Mapping.json": {
-                "energy": ["renewable", "solar", "wind", "efficiency", "grid", "power"],
-                "transportation": ["traffic", "mobility", "vehicle", "transit", "logistics"],
-                "healthcare": ["medical", "health", "hospital", "patient", "treatment"],
-                "education": ["school", "university", "student", "learning", "academic"],
-                "environment": ["climate", "pollution", "conservation", "sustainability"],
-                "economic": ["economy", "finance", "trade", "business", "investment"]
-            },
-            "05_Example_Input_Metadata.json": {
-                "name": "Renewable Energy Production Statistics",
-                "description": "Monthly statistics of renewable energy production across Saudi Arabia including solar, wind, and other clean energy sources.",
-                "keywords": ["renewable energy", "solar power", "wind energy", "clean energy", "sustainability"]
-            },
-            "12_Routing_Log_Format.json": {
-                "timestamp": "ISO datetime",
-                "dataset_name": "string",
-                "routing_decisions": [
-                    {
-                        "expert_name": "string",
-                        "expert_domain": "string",
-                        "can_handle": "boolean",
-                        "alignment_score": "float",
-                        "decision_timestamp": "ISO datetime"
-                    }
-                ],
-                "selected_experts": [
-                    {
-                        "name": "string",
-                        "domain": "string",
-                        "capabilities": ["array of strings"]
-                    }
-                ],
-                "routing_strategy": "string"
-            }
-        }
-        
-        for filename, content in sample_files.items():
-            filepath = os.path.join(self.data_dir, filename)
-            if not os.path.exists(filepath):
+        dir_index = self._refresh_index()
+        for filename, blob in _SAMPLE_FILE_BYTES.items():
+            if filename in dir_index:
+                continue
+            
+            # Write to a temporary name and publish with os.replace so readers
+            # never see a partially written file
+            filepath = self._file_path(filename)
+            tmp_path = filepath.with_name(f".{filename}.{os.getpid()}.tmp")
+            try:
+                fd = os.open(tmp_path, _WRITE_FLAGS, 0o666)
                 try:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(content, f, indent=2, ensure_ascii=False)
-                    self.logger.info(f"Created sample file: {filename}")
-                except Exception as e:
-                    self.logger.error(f"Failed to create sample file {filename}: {str(e)}")
+                    view = memoryview(blob)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, filepath)
+                self.logger.info("Created sample file: %s", filename)
+            except Exception as e:
+                self.logger.error("Failed to create sample file %s: %s", filename, e)
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+        
+        self._dir_index = None
+    
+    def _refresh_index(self) -> Dict[str, Any]:
+        """Rebuild the name -> stat index of files in the data directory."""
+        dir_index = {}
+        try:
+            with os.scandir(self.data_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        dir_index[entry.name] = file_stat(entry.path)
+        except OSError as e:
+            self.logger.error("Error scanning %s: %s", self.data_dir, e)
+        
+        self._dir_index = dir_index
+        return dir_index
+    
+    def _file_path(self, filename: str) -> Path:
+        """Return the cached path of a file in the data directory."""
+        path = self._path_cache.get(filename)
+        if path is None:
+            path = self._path_cache[filename] = self._data_path / filename
+        return path
+    
+    def _get_dir_index(self) -> Dict[str, Any]:
+        """Return the directory index, scanning the directory if needed."""
+        if self._dir_index is None:
+            return self._refresh_index()
+        return self._dir_index
     
     def _load_text_file(self, filename: str) -> Optional[str]:
         """Load content from a text file."""
-        filepath = os.path.join(self.data_dir, filename)
-        
-        if not os.path.exists(filepath):
-            return None
-        
-        try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return f.read().strip()
-        except Exception as e:
-            self.logger.error(f"Error reading {filename}: {str(e)}")
-            return None
+        return self._load_cached(filename, self._read_text)
     
     def _load_json_file(self, filename: str) -> Optional[Dict[str, Any]]:
         """Load content from a JSON file."""
-        filepath = os.path.join(self.data_dir, filename)
-        
-        if not os.path.exists(filepath):
+        return self._load_cached(filename, self._read_json)
+    
+    def _load_cached(self, filename: str, reader: Callable[[Path, int], Any]) -> Any:
+        """Return a file's parsed content, re-reading only when its mtime or size changed."""
+        entry_stat = self._get_dir_index().get(filename)
+        if entry_stat is None:
             return None
         
+        mtime_ns, size = entry_stat.st_mtime_ns, entry_stat.st_size
+        cached = self._file_cache.get(filename)
+        if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+            return cached[2]
+        
+        filepath = self._file_path(filename)
+        
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Error reading {filename}: {str(e)}")
+            content = reader(filepath, size)
+        except (OSError, ValueError) as e:
+            self.logger.error("Error reading %s: %s", filename, e)
             return None
+        
+        self._file_cache[filename] = (mtime_ns, size, content)
+        return content
+    
+    @staticmethod
+    def _read_text(filepath: Path, size: int) -> str:
+        """Read a text file with surrounding whitespace stripped."""
+        with _open_ro(filepath) as f:
+            if size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _decode_text(mm).strip()
+            return _decode_text(f.read()).strip()
+    
+    @staticmethod
+    def _read_json(filepath: Path, size: int) -> Any:
+        """Parse a JSON file."""
+        with _open_ro(filepath) as f:
+            if size > _MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+    
+    def iter_top_level(self, filename: str) -> Iterator[Tuple[str, Any]]:
+        """Yield the top-level (key, value) pairs of a JSON data file."""
+        return self._iter_json_file(filename)
+    
+    def _iter_json_file(self, filename: str, prefix: str = '') -> Iterator[Tuple[str, Any]]:
+        """
+        Stream the (key, value) pairs of the object(s) at an ijson prefix
+        without materializing the rest of the document.
+        """
+        if filename not in self._get_dir_index():
+            return
+        
+        if ijson is None:
+            yield from _kvitems(self._load_json_file(filename), prefix.split('.') if prefix else [])
+            return
+        
+        with _open_ro(self._file_path(filename)) as f:
+            yield from ijson.kvitems(f, prefix)
+    
+    def invalidate(self, filename: str):
+        """Drop the cached content and directory index entry for a file."""
+        self._file_cache.pop(filename, None)
+        self._dir_index = None
     
     def save_data(self, data: Dict[str, Any], filename: str, is_json: bool = True):
         """Save data to a file."""
-        filepath = os.path.join(self.data_dir, filename)
+        filepath = self._file_path(filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            with open(filepath, 'wb') as f:
                 if is_json:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    f.write(_dumps(data))
                 else:
-                    f.write(str(data))
+                    f.write(str(data).encode('utf-8'))
             
-            self.logger.info(f"Saved data to {filename}")
+            self.logger.info("Saved data to %s", filename)
             
         except Exception as e:
-            self.logger.error(f"Failed to save data to {filename}: {str(e)}")
+            self.logger.error("Failed to save data to %s: %s", filename, e)
+        
+        self.invalidate(filename)
     
     def get_data_file_status(self) -> Dict[str, Dict[str, Any]]:
         """Get status of all expected data files."""
-        expected_files = {
-            "text_files": [
-                "00_Model_Overview.txt",
-                "01_Expert_Roles_and_Responsibilities.txt",
-                "02_Expert_Capabilities.txt",
-                "03_Strategy_and_Objectives.txt",
-                "04_UseCase_Template.txt",
-                "07_Dataset_Classification_Rules.txt",
-                "08_Contextual_Constraints.txt",
-                "09_Context_Engineering_Workflow.txt",
-                "10_Router_Workflow_and_Logic.txt",
-                "11_Prompt_Template_for_LLM.txt",
-                "00_Model_Overview_OpenData.txt",
-                "01_Publishing_Recommendation_Template.txt",
-                "02_Publishing_Evaluation_Criteria.txt",
-                "03_Publishing_Strategy_Routing.txt",
-                "04_Publishing_Matching_Logic.txt"
-            ],
-            "json_files": [
-                "05_Example_Input_Metadata.json",
-                "06_Domain_Keyword_Mapping.json",
-                "12_Routing_Log_Format.json",
-                "13_Output_Audit_Log_Format.json",
-                "05_Example_Recommendation_Input.json",
-                "06_Publishing_Output_Log_Format.json"
-            ]
-        }
+        columns = self.get_data_file_status_soa()
+        exists, sizes = columns["exists"], columns["sizes"]
         
         status = {
-            "total_files": 0,
-            "existing_files": 0,
+            "total_files": len(exists),
+            "existing_files": sum(exists),
             "missing_files": [],
             "file_details": {}
         }
         
-        for file_type, files in expected_files.items():
-            for filename in files:
-                status["total_files"] += 1
-                filepath = os.path.join(self.data_dir, filename)
-                
-                if os.path.exists(filepath):
-                    status["existing_files"] += 1
-                    try:
-                        file_size = os.path.getsize(filepath)
-                        status["file_details"][filename] = {
-                            "exists": True,
-                            "size": file_size,
-                            "type": file_type
-                        }
-                    except Exception as e:
-                        status["file_details"][filename] = {
-                            "exists": True,
-                            "error": str(e),
-                            "type": file_type
-                        }
-                else:
-                    status["missing_files"].append(filename)
-                    status["file_details"][filename] = {
-                        "exists": False,
-                        "type": file_type
-                    }
-        
-        return status
\ No newline at end of file
+        for i, (filename, file_type) in enumerate(zip(columns["names"], columns["types"])):
+            if exists[i]:
+                status["file_details"][filename] = {
+                    "exists": True,
+                    "size": sizes[i],
+                    "type": file_type
+                }
+            else:
+                status["missing_files"].append(filename)
+                status["file_details"][filename] = {
+                    "exists": False,
+                    "type": file_type
+                }
+        
+        return status
+    
+    def get_data_file_status_soa(self) -> Dict[str, Any]:
+        """
+        Get the status of all expected data files as parallel columns:
+        names and types (tuples), sizes (array of int64, 0 when missing)
+        and exists (bytearray of 0/1 flags).
+        """
+        dir_index = self._refresh_index()
+        sizes = array('q', bytes(8 * len(_EXPECTED_NAMES)))
+        exists = bytearray(len(_EXPECTED_NAMES))
+        
+        for i, filename in enumerate(_EXPECTED_NAMES):
+            entry_stat = dir_index.get(filename)
+            if entry_stat is not None:
+                sizes[i] = entry_stat.st_size
+                exists[i] = 1
+        
+        return {
+            "names": _EXPECTED_NAMES,
+            "types": _EXPECTED_TYPES,
+            "sizes": sizes,
+            "exists": exists
+        }
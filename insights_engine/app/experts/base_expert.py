@@ -3,9 +3,42 @@ Base Expert Class - Template for all domain experts
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Mapping, Optional, Pattern, Sequence, Set, Tuple
 import logging
 
+from .._keyword_matcher import build_keyword_matcher, find_keywords, has_keywords
+
+
+# Checked in this order so the first missing field is the one reported
+_REQUIRED_USE_CASE_FIELDS = (
+    "title", "objective", "implementation",
+    "strategic_alignment", "impact_areas", "priority"
+)
+_VALID_PRIORITIES = frozenset({"high", "medium", "low"})
+
+
+@lru_cache(maxsize=None)
+def _shared_keyword_matcher(keywords: Tuple[str, ...]) -> Tuple[Pattern, Dict[str, List[str]]]:
+    """Build the matcher for a keyword set once per process; every expert instance using it shares the result."""
+    return build_keyword_matcher(keywords)
+
+
+# Distinct context texts and keyword lists whose lowercased forms are kept
+_LOWERED_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_LOWERED_CACHE_SIZE)
+def _lower_text(name: str, description: str) -> str:
+    """Lowercase a context's "name description" text once per distinct pair."""
+    return (name + ' ' + description).lower()
+
+
+@lru_cache(maxsize=_LOWERED_CACHE_SIZE)
+def _lower_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lowercase a context's keywords once per distinct keyword tuple."""
+    return tuple(kw.lower() for kw in keywords)
+
 
 class BaseExpert(ABC):
     """
@@ -14,13 +47,23 @@ class BaseExpert(ABC):
     Each expert specializes in a specific domain and can:
     1. Determine if they can handle a given dataset context
     2. Generate strategic use cases aligned with national objectives
+    
+    Subclasses should declare their own __slots__ so instances stay
+    without a per-instance __dict__.
     """
     
-    def __init__(self, name: str, domain: str, capabilities: List[str]):
+    __slots__ = ("name", "domain", "capabilities", "logger", "_keyword_pattern", "_keyword_prefixes")
+    
+    # Set per expert class once its static use case templates validate, see _prevalidate_templates()
+    _templates_validated = False
+    
+    def __init__(self, name: str, domain: str, capabilities: Sequence[str]):
         self.name = name
         self.domain = domain
         self.capabilities = capabilities
         self.logger = logging.getLogger(f"expert.{self.name.lower().replace(' ', '_')}")
+        # One-pass matcher over the domain keywords, used by find_domain_keywords()
+        self._keyword_pattern, self._keyword_prefixes = _shared_keyword_matcher(tuple(self.get_domain_keywords()))
     
     @abstractmethod
     def can_handle(self, context: Dict[str, Any]) -> bool:
@@ -64,14 +107,54 @@ class BaseExpert(ABC):
         """
         pass
     
-    def get_domain_keywords(self) -> List[str]:
+    def get_domain_keywords(self) -> Sequence[str]:
         """
         Get domain-specific keywords that this expert handles.
         
         Returns:
-            List of keywords relevant to this expert's domain
+            Ordered keywords relevant to this expert's domain
+        """
+        return ()
+    
+    def get_routing_domains(self) -> Optional[Iterable[str]]:
+        """
+        Get the domain classifications this expert accepts a context on.
+        
+        Experts returning domains here promise that can_handle() is only True
+        when the context has one of these domains, one of the domain keywords,
+        or domain keywords in its name and description, so the router can skip
+        them for other contexts.
+        
+        Returns:
+            Accepted domain classifications, or None to be evaluated on every context
         """
-        return []
+        return None
+    
+    def find_domain_keywords(self, text: str) -> Set[str]:
+        """
+        Find the domain keywords that occur in a text with a single scan.
+        
+        Args:
+            text: Lowercased dataset text
+        
+        Returns:
+            Set of domain keywords contained in the text
+        """
+        return find_keywords(self._keyword_pattern, self._keyword_prefixes, text)
+    
+    def has_domain_keywords(self, text: str, count: int) -> bool:
+        """
+        Check whether a text contains at least count distinct domain keywords,
+        stopping the scan as soon as it does.
+        
+        Args:
+            text: Lowercased dataset text
+            count: Number of distinct keywords required
+        
+        Returns:
+            bool: True if the text contains at least count domain keywords
+        """
+        return has_keywords(self._keyword_pattern, self._keyword_prefixes, text, count)
     
     def assess_strategic_alignment(self, context: Dict[str, Any]) -> float:
         """
@@ -85,18 +168,79 @@ class BaseExpert(ABC):
         """
         return 0.5  # Default neutral alignment
     
-    def log_routing_decision(self, context: Dict[str, Any], can_handle: bool, reason: str):
+    def evaluate(self, context: Dict[str, Any]) -> Tuple[bool, float]:
+        """
+        Decide whether this expert can handle a context and score its
+        strategic alignment in one call, as the router needs both.
+        
+        Args:
+            context: Dataset context dictionary
+        
+        Returns:
+            Tuple of (can_handle, alignment score); the score is 0.0 when the
+            expert cannot handle the context
+        """
+        can_handle = self.can_handle(context)
+        return can_handle, self.assess_strategic_alignment(context) if can_handle else 0.0
+    
+    def log_routing_decision(self, context: Dict[str, Any], can_handle: bool, reason: str, *reason_args: Any):
         """
         Log the routing decision for audit purposes.
         
         Args:
             context: Dataset context
             can_handle: Whether this expert can handle the context
-            reason: Reason for the decision
+            reason: Reason for the decision, as a %-format string when reason_args are given
+            reason_args: Arguments for reason, only formatted if the decision is logged
         """
-        self.logger.info(f"Routing Decision - Expert: {self.name}, "
-                        f"Dataset: {context.get('name', 'Unknown')}, "
-                        f"Can Handle: {can_handle}, Reason: {reason}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if reason_args:
+            reason = reason % reason_args
+        self.logger.info("Routing Decision - Expert: %s, Dataset: %s, Can Handle: %s, Reason: %s",
+                         self.name, context.get('name', 'Unknown'), can_handle, reason)
+    
+    @staticmethod
+    def _lowered_text(context: Dict[str, Any]) -> str:
+        """
+        Return the lowercased "name description" text of a context.
+        
+        Cached by the name and description themselves rather than on the
+        context, so every expert and method routing the same context shares
+        one copy, the context is left unchanged, and edits are never stale.
+        """
+        return _lower_text(context.get('name', ''), context.get('description', ''))
+    
+    @staticmethod
+    def _lowered_keywords(context: Dict[str, Any]) -> Tuple[str, ...]:
+        """
+        Return the lowercased keywords of a context as a tuple.
+        
+        Cached by the keywords themselves like _lowered_text(); the tuple is
+        hashable, so it can key the experts' match caches directly.
+        """
+        return _lower_keywords(tuple(context.get('keywords', ())))
+    
+    def _prevalidate_templates(self, templates: Iterable[Mapping[str, Any]]) -> None:
+        """
+        Validate an expert's static use case templates once.
+        
+        Use cases filled from templates that passed are known to be valid, so
+        generators can skip validate_use_case() on every call.
+        """
+        type(self)._templates_validated = all(self.validate_use_case(template) for template in templates)
+    
+    @staticmethod
+    def _fill_template(template: Mapping[str, Any], dataset_name: str) -> Dict[str, Any]:
+        """
+        Build a use case from a shared read-only template.
+        
+        The template's list fields are tuples, so they are shared rather than
+        copied; only the implementation text is formatted with the dataset name.
+        """
+        use_case = dict(template)
+        use_case["implementation"] = template["implementation"].format(dataset_name=dataset_name)
+        return use_case
     
     def validate_use_case(self, use_case: Dict[str, Any]) -> bool:
         """
@@ -108,18 +252,14 @@ class BaseExpert(ABC):
         Returns:
             bool: True if use case is valid, False otherwise
         """
-        required_fields = [
-            "title", "objective", "implementation", 
-            "strategic_alignment", "impact_areas", "priority"
-        ]
-        
-        for field in required_fields:
-            if field not in use_case or not use_case[field]:
-                self.logger.error(f"Missing or empty required field: {field}")
+        for field in _REQUIRED_USE_CASE_FIELDS:
+            if not use_case.get(field):
+                self.logger.error("Missing or empty required field: %s", field)
                 return False
         
-        if use_case["priority"] not in ["high", "medium", "low"]:
-            self.logger.error(f"Invalid priority value: {use_case['priority']}")
+        priority = use_case["priority"]
+        if not isinstance(priority, str) or priority not in _VALID_PRIORITIES:
+            self.logger.error("Invalid priority value: %s", priority)
             return False
         
         return True
\ No newline at end of file
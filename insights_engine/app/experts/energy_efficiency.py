@@ -2,8 +2,300 @@
 Energy Efficiency Expert - Specializes in energy efficiency, renewable energy, and sustainability
 """
 
-from typing import Dict, List, Any
-from .base_expert import BaseExpert
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Any, Tuple
+import logging
+from .base_expert import BaseExpert, _shared_keyword_matcher
+from .._keyword_matcher import best_rank_in, build_keyword_matcher, find_keywords
+
+
+# Energy and sustainability keywords, in reporting order, plus a set for membership tests
+_ENERGY_KEYWORDS: Tuple[str, ...] = (
+    'energy', 'renewable', 'solar', 'wind', 'hydroelectric', 'geothermal',
+    'efficiency', 'consumption', 'carbon', 'emissions', 'sustainability',
+    'grid', 'smart grid', 'electricity', 'power', 'utilities', 'fuel',
+    'green', 'clean', 'environment', 'climate', 'conservation',
+    'battery', 'storage', 'nuclear', 'fossil', 'natural gas',
+    'biomass', 'biofuel', 'photovoltaic', 'turbine'
+)
+_ENERGY_KEYWORD_SET = frozenset(_ENERGY_KEYWORDS)
+# The experts' shared matcher over the keywords, for _match_context()
+_ENERGY_PATTERN, _ENERGY_PREFIXES = _shared_keyword_matcher(_ENERGY_KEYWORDS)
+
+# Capabilities reported in routing logs
+_ENERGY_CAPABILITIES = (
+    "Renewable energy analysis",
+    "Energy consumption optimization",
+    "Carbon footprint reduction",
+    "Smart grid implementation",
+    "Energy policy development",
+    "Sustainability metrics",
+    "Green building standards",
+    "Energy storage solutions"
+)
+
+# Context engine domain classifications this expert handles outright
+_ENERGY_DOMAINS = frozenset({'energy', 'environment', 'sustainability', 'utilities'})
+
+# Focus areas in precedence order with their marker keywords; the first area
+# with any marker in the text wins
+_FOCUS_AREAS = (
+    ('renewable', ('renewable', 'solar', 'wind', 'clean')),
+    ('grid', ('grid', 'smart', 'distribution', 'transmission')),
+    ('efficiency', ('efficiency', 'optimization', 'conservation')),
+    ('policy', ('policy', 'regulation', 'incentive'))
+)
+_FOCUS_PATTERN, _FOCUS_PREFIXES = build_keyword_matcher(
+    marker for _, markers in _FOCUS_AREAS for marker in markers
+)
+_FOCUS_RANKS = {marker: rank for rank, (_, markers) in enumerate(_FOCUS_AREAS) for marker in markers}
+
+# Use case generator method for each focus area
+_FOCUS_GENERATORS = MappingProxyType({
+    'renewable': '_generate_renewable_use_case',
+    'efficiency': '_generate_efficiency_use_case',
+    'grid': '_generate_smart_grid_use_case',
+    'policy': '_generate_policy_use_case'
+})
+
+# Distinct domain keywords the name and description need on their own to route here
+_MIN_TEXT_MATCHES = 2
+
+# Routing decision reason, formatted only when the decision is logged
+_ROUTING_REASON = "Energy keyword matches: %d, Keyword list matches: %d, Domain match: %s"
+
+# Distinct contexts remembered by the routing, focus-area and alignment caches
+_MATCH_CACHE_SIZE = 256
+
+# Vision 2030 alignment markers; each hit adds 0.1, saturating at three hits
+_RENEWABLE_ALIGNMENT_KEYWORDS = ('renewable', 'solar', 'wind', 'clean', 'green')
+_EFFICIENCY_ALIGNMENT_KEYWORDS = ('efficiency', 'optimization', 'smart', 'conservation')
+_MAX_ALIGNMENT_HITS = 3
+
+
+@lru_cache(maxsize=_MATCH_CACHE_SIZE)
+def _focus_area(description: str, keywords: Tuple[str, ...]) -> str:
+    """Return the first focus area with a marker in the description or keywords."""
+    rank = best_rank_in(_FOCUS_PATTERN, _FOCUS_PREFIXES, _FOCUS_RANKS, chain((description,), keywords))
+    if rank is None:
+        return 'renewable'  # Default to renewable energy
+    return _FOCUS_AREAS[rank][0]
+
+
+@lru_cache(maxsize=_MATCH_CACHE_SIZE)
+def _match_context(dataset_text: str, keywords: Tuple[str, ...],
+                  domain_classification: Tuple[str, ...]) -> Tuple[bool, Tuple[int, int, bool]]:
+    """
+    Match a context's lowered text, keywords and domains.
+    
+    Returns (can_handle, matches), where matches fills in _ROUTING_REASON.
+    """
+    # Check for energy-related keywords
+    energy_matches = len(find_keywords(_ENERGY_PATTERN, _ENERGY_PREFIXES, dataset_text))
+    keyword_matches = sum(1 for keyword in keywords if keyword in _ENERGY_KEYWORD_SET)
+    
+    # Domain classification check
+    domain_match = not _ENERGY_DOMAINS.isdisjoint(domain_classification)
+    
+    can_handle = energy_matches >= _MIN_TEXT_MATCHES or keyword_matches >= 1 or domain_match
+    
+    return can_handle, (energy_matches, keyword_matches, domain_match)
+
+
+@lru_cache(maxsize=_MATCH_CACHE_SIZE)
+def _alignment_score(dataset_text: str) -> float:
+    """Score lowered dataset text against the Vision 2030 energy goals."""
+    base_score = 0.6  # Energy is always strategically important
+    
+    # Boost score for renewable energy and efficiency focus; the boost is
+    # capped, so stop scanning once it saturates
+    matches = 0
+    for kw in chain(_RENEWABLE_ALIGNMENT_KEYWORDS, _EFFICIENCY_ALIGNMENT_KEYWORDS):
+        if kw in dataset_text:
+            matches += 1
+            if matches >= _MAX_ALIGNMENT_HITS:
+                break
+    
+    alignment_boost = min(0.3, matches * 0.1)
+    
+    return min(1.0, base_score + alignment_boost)
+
+
+# Use case templates; only the implementation text depends on the dataset name
+_RENEWABLE_USE_CASE = MappingProxyType({
+    "title": "National Renewable Energy Expansion Strategy",
+    "objective": "Accelerate renewable energy adoption to achieve Vision 2030 diversification goals and reduce carbon footprint",
+    "implementation": "Utilize {dataset_name} to identify optimal locations for renewable energy projects, track installation progress, and measure impact on energy mix diversification",
+    "strategic_alignment": (
+        "Vision 2030 Energy Diversification",
+        "Saudi Green Initiative",
+        "Net Zero Carbon Emissions by 2060",
+        "NEOM Renewable Energy Projects"
+    ),
+    "impact_areas": (
+        "Energy Security",
+        "Environmental Sustainability",
+        "Economic Diversification",
+        "Job Creation",
+        "Technology Innovation"
+    ),
+    "priority": "high",
+    "timeline": "2024-2030",
+    "resources_required": (
+        "Ministry of Energy coordination",
+        "ACWA Power partnership",
+        "International renewable energy consultants",
+        "Advanced analytics platform",
+        "Regional energy authorities"
+    ),
+    "success_metrics": (
+        "Percentage of renewable energy in total capacity",
+        "CO2 emissions reduction",
+        "Investment attracted to renewable sector",
+        "Jobs created in green energy",
+        "Energy cost reduction per MWh"
+    )
+})
+
+_EFFICIENCY_USE_CASE = MappingProxyType({
+    "title": "National Energy Efficiency Optimization Program",
+    "objective": "Reduce energy consumption across all sectors while maintaining economic growth through smart efficiency measures",
+    "implementation": "Leverage {dataset_name} to identify energy waste patterns, benchmark consumption across sectors, and implement targeted efficiency interventions",
+    "strategic_alignment": (
+        "Vision 2030 Economic Diversification",
+        "Smart Cities Development",
+        "Industrial Competitiveness Enhancement",
+        "Sustainable Development Goals"
+    ),
+    "impact_areas": (
+        "Cost Reduction",
+        "Industrial Competitiveness",
+        "Environmental Protection",
+        "Energy Security",
+        "Smart City Development"
+    ),
+    "priority": "high",
+    "timeline": "2024-2027",
+    "resources_required": (
+        "Saudi Energy Efficiency Center",
+        "Smart metering infrastructure",
+        "Industrial sector partnerships",
+        "Building management systems",
+        "Energy auditing teams"
+    ),
+    "success_metrics": (
+        "Energy intensity reduction (kWh/GDP)",
+        "Annual energy cost savings",
+        "Efficiency retrofits completed",
+        "Smart meter deployment rate",
+        "Sector-wise consumption optimization"
+    )
+})
+
+_SMART_GRID_USE_CASE = MappingProxyType({
+    "title": "Intelligent National Grid Modernization",
+    "objective": "Transform the national electricity grid into a smart, resilient, and efficient system supporting renewable integration",
+    "implementation": "Use {dataset_name} to optimize grid operations, predict demand patterns, and enable seamless renewable energy integration",
+    "strategic_alignment": (
+        "Digital Transformation Vision 2030",
+        "Smart Cities Initiative",
+        "Energy Security Enhancement",
+        "Fourth Industrial Revolution adoption"
+    ),
+    "impact_areas": (
+        "Grid Reliability",
+        "Renewable Integration",
+        "Demand Response",
+        "Energy Storage Optimization",
+        "Predictive Maintenance"
+    ),
+    "priority": "medium",
+    "timeline": "2024-2028",
+    "resources_required": (
+        "Saudi Electricity Company partnership",
+        "Advanced grid analytics platform",
+        "Smart grid infrastructure investment",
+        "Cybersecurity framework",
+        "Technical training programs"
+    ),
+    "success_metrics": (
+        "Grid uptime percentage",
+        "Renewable integration capacity",
+        "Demand response participation",
+        "Grid efficiency improvement",
+        "Outage duration reduction"
+    )
+})
+
+_POLICY_USE_CASE = MappingProxyType({
+    "title": "Evidence-Based Energy Policy Development",
+    "objective": "Develop data-driven energy policies that support national strategic objectives and international commitments",
+    "implementation": "Analyze {dataset_name} to assess policy impact, design new regulations, and monitor compliance with international energy agreements",
+    "strategic_alignment": (
+        "Vision 2030 Implementation",
+        "Paris Climate Agreement",
+        "G20 Energy Sustainability Goals",
+        "Regional Energy Cooperation"
+    ),
+    "impact_areas": (
+        "Policy Effectiveness",
+        "Regulatory Compliance",
+        "International Relations",
+        "Investment Attraction",
+        "Market Development"
+    ),
+    "priority": "medium",
+    "timeline": "2024-2026",
+    "resources_required": (
+        "Ministry of Energy policy team",
+        "International energy agencies liaison",
+        "Economic impact modeling tools",
+        "Stakeholder consultation platform",
+        "Legal framework development"
+    ),
+    "success_metrics": (
+        "Policy implementation rate",
+        "Compliance improvement percentage",
+        "International ranking improvement",
+        "Stakeholder satisfaction scores",
+        "Regulatory impact assessment quality"
+    )
+})
+
+_FALLBACK_USE_CASE = MappingProxyType({
+    "title": "Strategic Energy Data Analytics Initiative",
+    "objective": "Leverage energy data for strategic decision-making and national energy planning",
+    "implementation": "Implement comprehensive analysis of {dataset_name} to support energy sector strategic planning and decision-making",
+    "strategic_alignment": (
+        "Vision 2030 Energy Goals",
+        "National Energy Strategy",
+        "Data-Driven Decision Making"
+    ),
+    "impact_areas": (
+        "Strategic Planning",
+        "Data Analytics",
+        "Energy Management"
+    ),
+    "priority": "medium",
+    "timeline": "2024-2025",
+    "resources_required": (
+        "Analytics team",
+        "Data infrastructure",
+        "Stakeholder coordination"
+    ),
+    "success_metrics": (
+        "Data utilization rate",
+        "Decision quality improvement",
+        "Strategic goal alignment"
+    )
+})
+
+_USE_CASE_TEMPLATES = (
+    _RENEWABLE_USE_CASE, _EFFICIENCY_USE_CASE, _SMART_GRID_USE_CASE,
+    _POLICY_USE_CASE, _FALLBACK_USE_CASE
+)
 
 
 class EnergyEfficiencyExpert(BaseExpert):
@@ -12,48 +304,34 @@ class EnergyEfficiencyExpert(BaseExpert):
     and sustainability initiatives aligned with national strategic objectives.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="Energy Efficiency Expert",
             domain="Energy & Sustainability",
-            capabilities=[
-                "Renewable energy analysis",
-                "Energy consumption optimization",
-                "Carbon footprint reduction",
-                "Smart grid implementation",
-                "Energy policy development",
-                "Sustainability metrics",
-                "Green building standards",
-                "Energy storage solutions"
-            ]
+            capabilities=_ENERGY_CAPABILITIES
         )
+        self._prevalidate_templates(_USE_CASE_TEMPLATES)
     
     def can_handle(self, context: Dict[str, Any]) -> bool:
         """
         Determine if this expert can handle energy-related datasets.
         """
-        energy_keywords = self.get_domain_keywords()
-        
-        # Check dataset name and description for energy-related terms
-        dataset_text = f"{context.get('name', '')} {context.get('description', '')}".lower()
-        keywords = [kw.lower() for kw in context.get('keywords', [])]
-        
-        # Check for energy-related keywords
-        energy_matches = sum(1 for keyword in energy_keywords if keyword in dataset_text)
-        keyword_matches = sum(1 for keyword in keywords if keyword in energy_keywords)
-        
-        # Domain classification check
-        domain_classification = context.get('domain_classification', [])
-        energy_domains = ['energy', 'environment', 'sustainability', 'utilities']
-        domain_match = any(domain in domain_classification for domain in energy_domains)
+        dataset_text = self._lowered_text(context)
+        keywords = self._lowered_keywords(context)
+        domain_classification = context.get('domain_classification', ())
         
-        can_handle = energy_matches >= 2 or keyword_matches >= 1 or domain_match
+        if not self.logger.isEnabledFor(logging.INFO):
+            # No decision to log, so stop at the first check that passes,
+            # cheapest first
+            return (not _ENERGY_DOMAINS.isdisjoint(domain_classification)
+                    or not _ENERGY_KEYWORD_SET.isdisjoint(keywords)
+                    or self.has_domain_keywords(dataset_text, _MIN_TEXT_MATCHES))
         
-        reason = f"Energy keyword matches: {energy_matches}, " \
-                f"Keyword list matches: {keyword_matches}, " \
-                f"Domain match: {domain_match}"
+        can_handle, matches = _match_context(dataset_text, keywords, tuple(domain_classification))
         
-        self.log_routing_decision(context, can_handle, reason)
+        self.log_routing_decision(context, can_handle, _ROUTING_REASON, *matches)
         return can_handle
     
     def generate_use_case(self, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -77,245 +355,57 @@ class EnergyEfficiencyExpert(BaseExpert):
         # Determine specific energy focus area
         focus_area = self._determine_focus_area(description, keywords)
         
-        use_cases = {
-            'renewable': self._generate_renewable_use_case(dataset_name, description),
-            'efficiency': self._generate_efficiency_use_case(dataset_name, description),
-            'grid': self._generate_smart_grid_use_case(dataset_name, description),
-            'policy': self._generate_policy_use_case(dataset_name, description)
-        }
+        # Build only the selected focus area's use case
+        generator = getattr(self, _FOCUS_GENERATORS.get(focus_area, _FOCUS_GENERATORS['renewable']))
+        selected_use_case = generator(dataset_name, description)
         
-        selected_use_case = use_cases.get(focus_area, use_cases['renewable'])
-        
-        # Validate and return
-        if self.validate_use_case(selected_use_case):
+        # Validate and return; cases filled from prevalidated templates are known-good
+        if self._templates_validated or self.validate_use_case(selected_use_case):
             return selected_use_case
         else:
             # Return a fallback use case if validation fails
             return self._generate_fallback_use_case(dataset_name, description)
     
-    def get_domain_keywords(self) -> List[str]:
+    def get_domain_keywords(self) -> Tuple[str, ...]:
         """
         Return energy and sustainability related keywords.
         """
-        return [
-            'energy', 'renewable', 'solar', 'wind', 'hydroelectric', 'geothermal',
-            'efficiency', 'consumption', 'carbon', 'emissions', 'sustainability',
-            'grid', 'smart grid', 'electricity', 'power', 'utilities', 'fuel',
-            'green', 'clean', 'environment', 'climate', 'conservation',
-            'battery', 'storage', 'nuclear', 'fossil', 'natural gas',
-            'biomass', 'biofuel', 'photovoltaic', 'turbine'
-        ]
+        return _ENERGY_KEYWORDS
+    
+    def get_routing_domains(self) -> FrozenSet[str]:
+        """
+        Return the domain classifications routed to this expert.
+        """
+        return _ENERGY_DOMAINS
     
     def assess_strategic_alignment(self, context: Dict[str, Any]) -> float:
         """
         Assess alignment with Vision 2030 energy diversification goals.
         """
-        base_score = 0.6  # Energy is always strategically important
-        
-        renewable_keywords = ['renewable', 'solar', 'wind', 'clean', 'green']
-        efficiency_keywords = ['efficiency', 'optimization', 'smart', 'conservation']
-        
-        dataset_text = f"{context.get('name', '')} {context.get('description', '')}".lower()
-        
-        # Boost score for renewable energy focus
-        renewable_matches = sum(1 for kw in renewable_keywords if kw in dataset_text)
-        efficiency_matches = sum(1 for kw in efficiency_keywords if kw in dataset_text)
-        
-        alignment_boost = min(0.3, (renewable_matches + efficiency_matches) * 0.1)
-        
-        return min(1.0, base_score + alignment_boost)
+        return _alignment_score(self._lowered_text(context))
     
     def _determine_focus_area(self, description: str, keywords: List[str]) -> str:
         """
         Determine the specific energy focus area based on description and keywords.
         """
-        text = f"{description} {' '.join(keywords)}".lower()
-        
-        if any(kw in text for kw in ['renewable', 'solar', 'wind', 'clean']):
-            return 'renewable'
-        elif any(kw in text for kw in ['grid', 'smart', 'distribution', 'transmission']):
-            return 'grid'
-        elif any(kw in text for kw in ['efficiency', 'optimization', 'conservation']):
-            return 'efficiency'
-        elif any(kw in text for kw in ['policy', 'regulation', 'incentive']):
-            return 'policy'
-        else:
-            return 'renewable'  # Default to renewable energy
+        return _focus_area(description, tuple(keywords))
     
     def _generate_renewable_use_case(self, dataset_name: str, description: str) -> Dict[str, Any]:
         """Generate renewable energy focused use case."""
-        return {
-            "title": "National Renewable Energy Expansion Strategy",
-            "objective": "Accelerate renewable energy adoption to achieve Vision 2030 diversification goals and reduce carbon footprint",
-            "implementation": f"Utilize {dataset_name} to identify optimal locations for renewable energy projects, track installation progress, and measure impact on energy mix diversification",
-            "strategic_alignment": [
-                "Vision 2030 Energy Diversification",
-                "Saudi Green Initiative",
-                "Net Zero Carbon Emissions by 2060",
-                "NEOM Renewable Energy Projects"
-            ],
-            "impact_areas": [
-                "Energy Security",
-                "Environmental Sustainability",
-                "Economic Diversification",
-                "Job Creation",
-                "Technology Innovation"
-            ],
-            "priority": "high",
-            "timeline": "2024-2030",
-            "resources_required": [
-                "Ministry of Energy coordination",
-                "ACWA Power partnership",
-                "International renewable energy consultants",
-                "Advanced analytics platform",
-                "Regional energy authorities"
-            ],
-            "success_metrics": [
-                "Percentage of renewable energy in total capacity",
-                "CO2 emissions reduction",
-                "Investment attracted to renewable sector",
-                "Jobs created in green energy",
-                "Energy cost reduction per MWh"
-            ]
-        }
+        return self._fill_template(_RENEWABLE_USE_CASE, dataset_name)
     
     def _generate_efficiency_use_case(self, dataset_name: str, description: str) -> Dict[str, Any]:
         """Generate energy efficiency focused use case."""
-        return {
-            "title": "National Energy Efficiency Optimization Program",
-            "objective": "Reduce energy consumption across all sectors while maintaining economic growth through smart efficiency measures",
-            "implementation": f"Leverage {dataset_name} to identify energy waste patterns, benchmark consumption across sectors, and implement targeted efficiency interventions",
-            "strategic_alignment": [
-                "Vision 2030 Economic Diversification",
-                "Smart Cities Development",
-                "Industrial Competitiveness Enhancement",
-                "Sustainable Development Goals"
-            ],
-            "impact_areas": [
-                "Cost Reduction",
-                "Industrial Competitiveness",
-                "Environmental Protection",
-                "Energy Security",
-                "Smart City Development"
-            ],
-            "priority": "high",
-            "timeline": "2024-2027",
-            "resources_required": [
-                "Saudi Energy Efficiency Center",
-                "Smart metering infrastructure",
-                "Industrial sector partnerships",
-                "Building management systems",
-                "Energy auditing teams"
-            ],
-            "success_metrics": [
-                "Energy intensity reduction (kWh/GDP)",
-                "Annual energy cost savings",
-                "Efficiency retrofits completed",
-                "Smart meter deployment rate",
-                "Sector-wise consumption optimization"
-            ]
-        }
+        return self._fill_template(_EFFICIENCY_USE_CASE, dataset_name)
     
     def _generate_smart_grid_use_case(self, dataset_name: str, description: str) -> Dict[str, Any]:
         """Generate smart grid focused use case."""
-        return {
-            "title": "Intelligent National Grid Modernization",
-            "objective": "Transform the national electricity grid into a smart, resilient, and efficient system supporting renewable integration",
-            "implementation": f"Use {dataset_name} to optimize grid operations, predict demand patterns, and enable seamless renewable energy integration",
-            "strategic_alignment": [
-                "Digital Transformation Vision 2030",
-                "Smart Cities Initiative",
-                "Energy Security Enhancement",
-                "Fourth Industrial Revolution adoption"
-            ],
-            "impact_areas": [
-                "Grid Reliability",
-                "Renewable Integration",
-                "Demand Response",
-                "Energy Storage Optimization",
-                "Predictive Maintenance"
-            ],
-            "priority": "medium",
-            "timeline": "2024-2028",
-            "resources_required": [
-                "Saudi Electricity Company partnership",
-                "Advanced grid analytics platform",
-                "Smart grid infrastructure investment",
-                "Cybersecurity framework",
-                "Technical training programs"
-            ],
-            "success_metrics": [
-                "Grid uptime percentage",
-                "Renewable integration capacity",
-                "Demand response participation",
-                "Grid efficiency improvement",
-                "Outage duration reduction"
-            ]
-        }
+        return self._fill_template(_SMART_GRID_USE_CASE, dataset_name)
     
     def _generate_policy_use_case(self, dataset_name: str, description: str) -> Dict[str, Any]:
         """Generate energy policy focused use case."""
-        return {
-            "title": "Evidence-Based Energy Policy Development",
-            "objective": "Develop data-driven energy policies that support national strategic objectives and international commitments",
-            "implementation": f"Analyze {dataset_name} to assess policy impact, design new regulations, and monitor compliance with international energy agreements",
-            "strategic_alignment": [
-                "Vision 2030 Implementation",
-                "Paris Climate Agreement",
-                "G20 Energy Sustainability Goals",
-                "Regional Energy Cooperation"
-            ],
-            "impact_areas": [
-                "Policy Effectiveness",
-                "Regulatory Compliance",
-                "International Relations",
-                "Investment Attraction",
-                "Market Development"
-            ],
-            "priority": "medium",
-            "timeline": "2024-2026",
-            "resources_required": [
-                "Ministry of Energy policy team",
-                "International energy agencies liaison",
-                "Economic impact modeling tools",
-                "Stakeholder consultation platform",
-                "Legal framework development"
-            ],
-            "success_metrics": [
-                "Policy implementation rate",
-                "Compliance improvement percentage",
-                "International ranking improvement",
-                "Stakeholder satisfaction scores",
-                "Regulatory impact assessment quality"
-            ]
-        }
+        return self._fill_template(_POLICY_USE_CASE, dataset_name)
     
     def _generate_fallback_use_case(self, dataset_name: str, description: str) -> Dict[str, Any]:
         """Generate a generic energy-related use case as fallback."""
-        return {
-            "title": "Strategic Energy Data Analytics Initiative",
-            "objective": "Leverage energy data for strategic decision-making and national energy planning",
-            "implementation": f"Implement comprehensive analysis of {dataset_name} to support energy sector strategic planning and decision-making",
-            "strategic_alignment": [
-                "Vision 2030 Energy Goals",
-                "National Energy Strategy",
-                "Data-Driven Decision Making"
-            ],
-            "impact_areas": [
-                "Strategic Planning",
-                "Data Analytics",
-                "Energy Management"
-            ],
-            "priority": "medium",
-            "timeline": "2024-2025",
-            "resources_required": [
-                "Analytics team",
-                "Data infrastructure",
-                "Stakeholder coordination"
-            ],
-            "success_metrics": [
-                "Data utilization rate",
-                "Decision quality improvement",
-                "Strategic goal alignment"
-            ]
-        }
\ No newline at end of file
+        return self._fill_template(_FALLBACK_USE_CASE, dataset_name)
@@ -2,8 +2,274 @@
 Transportation Expert - Specializes in transportation, logistics, and mobility
 """
 
-from typing import Dict, List, Any
-from .base_expert import BaseExpert
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Any, Tuple
+import logging
+from .base_expert import BaseExpert, _shared_keyword_matcher
+from .._keyword_matcher import best_rank_in, build_keyword_matcher, find_keywords
+
+
+# Transportation and mobility keywords, in reporting order, plus a set for membership tests
+_TRANSPORT_KEYWORDS: Tuple[str, ...] = (
+    'transport', 'transportation', 'traffic', 'vehicle', 'car', 'truck',
+    'bus', 'metro', 'train', 'railway', 'road', 'highway', 'street',
+    'mobility', 'logistics', 'freight', 'cargo', 'shipping', 'delivery',
+    'public transport', 'transit', 'commute', 'journey', 'route',
+    'navigation', 'gps', 'mapping', 'fleet', 'aviation', 'airport',
+    'port', 'maritime', 'bicycle', 'pedestrian', 'parking'
+)
+_TRANSPORT_KEYWORD_SET = frozenset(_TRANSPORT_KEYWORDS)
+# The experts' shared matcher over the keywords, for _match_context()
+_TRANSPORT_PATTERN, _TRANSPORT_PREFIXES = _shared_keyword_matcher(_TRANSPORT_KEYWORDS)
+
+# Capabilities reported in routing logs
+_TRANSPORT_CAPABILITIES = (
+    "Traffic flow optimization",
+    "Public transport planning",
+    "Logistics network design",
+    "Smart mobility solutions",
+    "Transportation infrastructure",
+    "Fleet management",
+    "Route optimization",
+    "Multimodal integration"
+)
+
+# Context engine domain classifications this expert handles outright
+_TRANSPORT_DOMAINS = frozenset({'transportation', 'logistics', 'mobility', 'traffic'})
+
+# Focus areas in precedence order with their marker keywords; the first area
+# with any marker in the text wins
+_FOCUS_AREAS = (
+    ('smart_mobility', ('smart', 'intelligent', 'autonomous', 'connected')),
+    ('public_transport', ('public', 'bus', 'metro', 'train', 'transit')),
+    ('logistics', ('freight', 'cargo', 'logistics', 'delivery')),
+    ('traffic', ('traffic', 'congestion', 'flow', 'signal'))
+)
+_FOCUS_PATTERN, _FOCUS_PREFIXES = build_keyword_matcher(
+    marker for _, markers in _FOCUS_AREAS for marker in markers
+)
+_FOCUS_RANKS = {marker: rank for rank, (_, markers) in enumerate(_FOCUS_AREAS) for marker in markers}
+
+# Use case generator method for each focus area
+_FOCUS_GENERATORS = MappingProxyType({
+    'smart_mobility': '_generate_smart_mobility_use_case',
+    'public_transport': '_generate_public_transport_use_case',
+    'logistics': '_generate_logistics_use_case',
+    'traffic': '_generate_traffic_use_case'
+})
+
+# Distinct domain keywords the name and description need on their own to route here
+_MIN_TEXT_MATCHES = 2
+
+# Routing decision reason, formatted only when the decision is logged
+_ROUTING_REASON = "Transport keyword matches: %d, Keyword list matches: %d, Domain match: %s"
+
+# Distinct contexts remembered by the routing and focus-area caches
+_MATCH_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_MATCH_CACHE_SIZE)
+def _focus_area(description: str, keywords: Tuple[str, ...]) -> str:
+    """Return the first focus area with a marker in the description or keywords."""
+    rank = best_rank_in(_FOCUS_PATTERN, _FOCUS_PREFIXES, _FOCUS_RANKS, chain((description,), keywords))
+    if rank is None:
+        return 'smart_mobility'
+    return _FOCUS_AREAS[rank][0]
+
+
+@lru_cache(maxsize=_MATCH_CACHE_SIZE)
+def _match_context(dataset_text: str, keywords: Tuple[str, ...],
+                  domain_classification: Tuple[str, ...]) -> Tuple[bool, Tuple[int, int, bool]]:
+    """
+    Match a context's lowered text, keywords and domains.
+    
+    Returns (can_handle, matches), where matches fills in _ROUTING_REASON.
+    """
+    transport_matches = len(find_keywords(_TRANSPORT_PATTERN, _TRANSPORT_PREFIXES, dataset_text))
+    keyword_matches = sum(1 for keyword in keywords if keyword in _TRANSPORT_KEYWORD_SET)
+    
+    domain_match = not _TRANSPORT_DOMAINS.isdisjoint(domain_classification)
+    
+    can_handle = transport_matches >= _MIN_TEXT_MATCHES or keyword_matches >= 1 or domain_match
+    
+    return can_handle, (transport_matches, keyword_matches, domain_match)
+
+
+# Use case templates; only the implementation text depends on the dataset name
+_SMART_MOBILITY_USE_CASE = MappingProxyType({
+    "title": "Integrated Smart Mobility Ecosystem",
+    "objective": "Develop a comprehensive smart mobility platform supporting Vision 2030 smart city initiatives",
+    "implementation": "Leverage {dataset_name} to create intelligent transportation systems that optimize mobility flows and reduce congestion",
+    "strategic_alignment": (
+        "NEOM Smart City Development",
+        "Vision 2030 Quality of Life Program",
+        "Digital Transformation Initiative",
+        "Sustainable Urban Development"
+    ),
+    "impact_areas": (
+        "Urban Planning",
+        "Traffic Optimization",
+        "Environmental Impact",
+        "Citizen Experience",
+        "Economic Efficiency"
+    ),
+    "priority": "high",
+    "timeline": "2024-2028",
+    "resources_required": (
+        "Ministry of Transport coordination",
+        "Smart city technology platforms",
+        "IoT infrastructure deployment",
+        "Public-private partnerships",
+        "Citizen engagement programs"
+    ),
+    "success_metrics": (
+        "Average commute time reduction",
+        "Traffic congestion index improvement",
+        "Public transport ridership increase",
+        "Carbon emissions reduction",
+        "Citizen satisfaction scores"
+    )
+})
+
+_PUBLIC_TRANSPORT_USE_CASE = MappingProxyType({
+    "title": "National Public Transport Optimization",
+    "objective": "Enhance public transportation efficiency and accessibility to support sustainable urban mobility",
+    "implementation": "Utilize {dataset_name} to optimize routes, schedules, and capacity planning for public transport systems",
+    "strategic_alignment": (
+        "Riyadh Metro Project",
+        "Public Transport Company development",
+        "Sustainable mobility goals",
+        "Urban connectivity improvement"
+    ),
+    "impact_areas": (
+        "Public Service Quality",
+        "Environmental Sustainability",
+        "Social Equity",
+        "Economic Development",
+        "Urban Accessibility"
+    ),
+    "priority": "high",
+    "timeline": "2024-2027",
+    "resources_required": (
+        "Public Transport Company",
+        "Route optimization software",
+        "Passenger information systems",
+        "Fleet management platforms",
+        "Community feedback mechanisms"
+    ),
+    "success_metrics": (
+        "Public transport usage rates",
+        "Service reliability indicators",
+        "Passenger satisfaction scores",
+        "Route efficiency metrics",
+        "Accessibility coverage expansion"
+    )
+})
+
+_LOGISTICS_USE_CASE = MappingProxyType({
+    "title": "National Logistics Hub Development",
+    "objective": "Position Saudi Arabia as a global logistics hub connecting three continents",
+    "implementation": "Apply {dataset_name} to optimize freight movement, reduce logistics costs, and improve supply chain efficiency",
+    "strategic_alignment": (
+        "Vision 2030 Logistics Strategy",
+        "Belt and Road Initiative participation",
+        "Economic diversification goals",
+        "Industrial sector competitiveness"
+    ),
+    "impact_areas": (
+        "Trade Facilitation",
+        "Economic Growth",
+        "International Connectivity",
+        "Industrial Development",
+        "Employment Creation"
+    ),
+    "priority": "medium",
+    "timeline": "2024-2029",
+    "resources_required": (
+        "Saudi Logistics Authority",
+        "Port and airport authorities",
+        "Private logistics companies",
+        "Customs digitization systems",
+        "International trade partnerships"
+    ),
+    "success_metrics": (
+        "Logistics performance index ranking",
+        "Freight movement efficiency",
+        "Cross-border trade volume",
+        "Logistics cost reduction",
+        "Hub connectivity indicators"
+    )
+})
+
+_TRAFFIC_USE_CASE = MappingProxyType({
+    "title": "Intelligent Traffic Management System",
+    "objective": "Implement AI-driven traffic management to reduce congestion and improve road safety",
+    "implementation": "Deploy {dataset_name} in smart traffic control systems for real-time optimization and predictive management",
+    "strategic_alignment": (
+        "Smart Cities Development",
+        "Road safety improvement goals",
+        "Environmental protection targets",
+        "Digital government initiatives"
+    ),
+    "impact_areas": (
+        "Traffic Flow Optimization",
+        "Road Safety Enhancement",
+        "Air Quality Improvement",
+        "Economic Productivity",
+        "Citizen Satisfaction"
+    ),
+    "priority": "medium",
+    "timeline": "2024-2026",
+    "resources_required": (
+        "Traffic management authorities",
+        "Smart traffic infrastructure",
+        "AI analytics platforms",
+        "Emergency response coordination",
+        "Public awareness campaigns"
+    ),
+    "success_metrics": (
+        "Traffic flow improvement rates",
+        "Accident reduction percentage",
+        "Emergency response times",
+        "Fuel consumption reduction",
+        "Air quality indicators"
+    )
+})
+
+_FALLBACK_USE_CASE = MappingProxyType({
+    "title": "Transportation Data Analytics Initiative",
+    "objective": "Leverage transportation data for strategic planning and system optimization",
+    "implementation": "Implement analysis of {dataset_name} to support transportation sector strategic planning",
+    "strategic_alignment": (
+        "Vision 2030 Transportation Goals",
+        "National Transportation Strategy",
+        "Data-Driven Transportation Planning"
+    ),
+    "impact_areas": (
+        "Strategic Planning",
+        "System Optimization",
+        "Transportation Management"
+    ),
+    "priority": "medium",
+    "timeline": "2024-2025",
+    "resources_required": (
+        "Transportation analytics team",
+        "Data processing infrastructure",
+        "Stakeholder coordination"
+    ),
+    "success_metrics": (
+        "Data utilization effectiveness",
+        "Planning process improvement",
+        "System performance indicators"
+    )
+})
+
+_USE_CASE_TEMPLATES = (
+    _SMART_MOBILITY_USE_CASE, _PUBLIC_TRANSPORT_USE_CASE, _LOGISTICS_USE_CASE,
+    _TRAFFIC_USE_CASE, _FALLBACK_USE_CASE
+)
 
 
 class TransportationExpert(BaseExpert):
@@ -12,43 +278,32 @@ class TransportationExpert(BaseExpert):
     urban mobility, and smart transportation infrastructure.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         super().__init__(
             name="Transportation Expert",
             domain="Transportation & Mobility",
-            capabilities=[
-                "Traffic flow optimization",
-                "Public transport planning",
-                "Logistics network design",
-                "Smart mobility solutions",
-                "Transportation infrastructure",
-                "Fleet management",
-                "Route optimization",
-                "Multimodal integration"
-            ]
+            capabilities=_TRANSPORT_CAPABILITIES
         )
+        self._prevalidate_templates(_USE_CASE_TEMPLATES)
     
     def can_handle(self, context: Dict[str, Any]) -> bool:
         """Determine if this expert can handle transportation-related datasets."""
-        transport_keywords = self.get_domain_keywords()
-        
-        dataset_text = f"{context.get('name', '')} {context.get('description', '')}".lower()
-        keywords = [kw.lower() for kw in context.get('keywords', [])]
-        
-        transport_matches = sum(1 for keyword in transport_keywords if keyword in dataset_text)
-        keyword_matches = sum(1 for keyword in keywords if keyword in transport_keywords)
-        
-        domain_classification = context.get('domain_classification', [])
-        transport_domains = ['transportation', 'logistics', 'mobility', 'traffic']
-        domain_match = any(domain in domain_classification for domain in transport_domains)
+        dataset_text = self._lowered_text(context)
+        keywords = self._lowered_keywords(context)
+        domain_classification = context.get('domain_classification', ())
         
-        can_handle = transport_matches >= 2 or keyword_matches >= 1 or domain_match
+        if not self.logger.isEnabledFor(logging.INFO):
+            # No decision to log, so stop at the first check that passes,
+            # cheapest first
+            return (not _TRANSPORT_DOMAINS.isdisjoint(domain_classification)
+                    or not _TRANSPORT_KEYWORD_SET.isdisjoint(keywords)
+                    or self.has_domain_keywords(dataset_text, _MIN_TEXT_MATCHES))
         
-        reason = f"Transport keyword matches: {transport_matches}, " \
-                f"Keyword list matches: {keyword_matches}, " \
-                f"Domain match: {domain_match}"
+        can_handle, matches = _match_context(dataset_text, keywords, tuple(domain_classification))
         
-        self.log_routing_decision(context, can_handle, reason)
+        self.log_routing_decision(context, can_handle, _ROUTING_REASON, *matches)
         return can_handle
     
     def generate_use_case(self, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -59,220 +314,42 @@ class TransportationExpert(BaseExpert):
         
         focus_area = self._determine_focus_area(description, keywords)
         
-        use_cases = {
-            'smart_mobility': self._generate_smart_mobility_use_case(dataset_name, description),
-            'public_transport': self._generate_public_transport_use_case(dataset_name, description),
-            'logistics': self._generate_logistics_use_case(dataset_name, description),
-            'traffic': self._generate_traffic_use_case(dataset_name, description)
-        }
+        generator = getattr(self, _FOCUS_GENERATORS.get(focus_area, _FOCUS_GENERATORS['smart_mobility']))
+        selected_use_case = generator(dataset_name, description)
         
-        selected_use_case = use_cases.get(focus_area, use_cases['smart_mobility'])
-        
-        if self.validate_use_case(selected_use_case):
+        if self._templates_validated or self.validate_use_case(selected_use_case):
             return selected_use_case
         else:
             return self._generate_fallback_use_case(dataset_name, description)
     
-    def get_domain_keywords(self) -> List[str]:
+    def get_domain_keywords(self) -> Tuple[str, ...]:
         """Return transportation and mobility related keywords."""
-        return [
-            'transport', 'transportation', 'traffic', 'vehicle', 'car', 'truck',
-            'bus', 'metro', 'train', 'railway', 'road', 'highway', 'street',
-            'mobility', 'logistics', 'freight', 'cargo', 'shipping', 'delivery',
-            'public transport', 'transit', 'commute', 'journey', 'route',
-            'navigation', 'gps', 'mapping', 'fleet', 'aviation', 'airport',
-            'port', 'maritime', 'bicycle', 'pedestrian', 'parking'
-        ]
+        return _TRANSPORT_KEYWORDS
+    
+    def get_routing_domains(self) -> FrozenSet[str]:
+        """Return the domain classifications routed to this expert."""
+        return _TRANSPORT_DOMAINS
     
     def _determine_focus_area(self, description: str, keywords: List[str]) -> str:
         """Determine specific transportation focus area."""
-        text = f"{description} {' '.join(keywords)}".lower()
-        
-        if any(kw in text for kw in ['smart', 'intelligent', 'autonomous', 'connected']):
-            return 'smart_mobility'
-        elif any(kw in text for kw in ['public', 'bus', 'metro', 'train', 'transit']):
-            return 'public_transport'
-        elif any(kw in text for kw in ['freight', 'cargo', 'logistics', 'delivery']):
-            return 'logistics'
-        elif any(kw in text for kw in ['traffic', 'congestion', 'flow', 'signal']):
-            return 'traffic'
-        else:
-            return 'smart_mobility'
+        return _focus_area(description, tuple(keywords))
     
     def _generate_smart_mobility_use_case(self, dataset_name: str, description: str) -> Dict[str, Any]:
         """Generate smart mobility use case."""
-        return {
-            "title": "Integrated Smart Mobility Ecosystem",
-            "objective": "Develop a comprehensive smart mobility platform supporting Vision 2030 smart city initiatives",
-            "implementation": f"Leverage {dataset_name} to create intelligent transportation systems that optimize mobility flows and reduce congestion",
-            "strategic_alignment": [
-                "NEOM Smart City Development",
-                "Vision 2030 Quality of Life Program",
-                "Digital Transformation Initiative",
-                "Sustainable Urban Development"
-            ],
-            "impact_areas": [
-                "Urban Planning",
-                "Traffic Optimization",
-                "Environmental Impact",
-                "Citizen Experience",
-                "Economic Efficiency"
-            ],
-            "priority": "high",
-            "timeline": "2024-2028",
-            "resources_required": [
-                "Ministry of Transport coordination",
-                "Smart city technology platforms",
-                "IoT infrastructure deployment",
-                "Public-private partnerships",
-                "Citizen engagement programs"
-            ],
-            "success_metrics": [
-                "Average commute time reduction",
-                "Traffic congestion index improvement",
-                "Public transport ridership increase",
-                "Carbon emissions reduction",
-                "Citizen satisfaction scores"
-            ]
-        }
+        return self._fill_template(_SMART_MOBILITY_USE_CASE, dataset_name)
     
     def _generate_public_transport_use_case(self, dataset_name: str, description: str) -> Dict[str, Any]:
         """Generate public transport use case."""
-        return {
-            "title": "National Public Transport Optimization",
-            "objective": "Enhance public transportation efficiency and accessibility to support sustainable urban mobility",
-            "implementation": f"Utilize {dataset_name} to optimize routes, schedules, and capacity planning for public transport systems",
-            "strategic_alignment": [
-                "Riyadh Metro Project",
-                "Public Transport Company development",
-                "Sustainable mobility goals",
-                "Urban connectivity improvement"
-            ],
-            "impact_areas": [
-                "Public Service Quality",
-                "Environmental Sustainability",
-                "Social Equity",
-                "Economic Development",
-                "Urban Accessibility"
-            ],
-            "priority": "high",
-            "timeline": "2024-2027",
-            "resources_required": [
-                "Public Transport Company",
-                "Route optimization software",
-                "Passenger information systems",
-                "Fleet management platforms",
-                "Community feedback mechanisms"
-            ],
-            "success_metrics": [
-                "Public transport usage rates",
-                "Service reliability indicators",
-                "Passenger satisfaction scores",
-                "Route efficiency metrics",
-                "Accessibility coverage expansion"
-            ]
-        }
+        return self._fill_template(_PUBLIC_TRANSPORT_USE_CASE, dataset_name)
     
     def _generate_logistics_use_case(self, dataset_name: str, description: str) -> Dict[str, Any]:
         """Generate logistics use case."""
-        return {
-            "title": "National Logistics Hub Development",
-            "objective": "Position Saudi Arabia as a global logistics hub connecting three continents",
-            "implementation": f"Apply {dataset_name} to optimize freight movement, reduce logistics costs, and improve supply chain efficiency",
-            "strategic_alignment": [
-                "Vision 2030 Logistics Strategy",
-                "Belt and Road Initiative participation",
-                "Economic diversification goals",
-                "Industrial sector competitiveness"
-            ],
-            "impact_areas": [
-                "Trade Facilitation",
-                "Economic Growth",
-                "International Connectivity",
-                "Industrial Development",
-                "Employment Creation"
-            ],
-            "priority": "medium",
-            "timeline": "2024-2029",
-            "resources_required": [
-                "Saudi Logistics Authority",
-                "Port and airport authorities",
-                "Private logistics companies",
-                "Customs digitization systems",
-                "International trade partnerships"
-            ],
-            "success_metrics": [
-                "Logistics performance index ranking",
-                "Freight movement efficiency",
-                "Cross-border trade volume",
-                "Logistics cost reduction",
-                "Hub connectivity indicators"
-            ]
-        }
+        return self._fill_template(_LOGISTICS_USE_CASE, dataset_name)
     
     def _generate_traffic_use_case(self, dataset_name: str, description: str) -> Dict[str, Any]:
         """Generate traffic management use case."""
-        return {
-            "title": "Intelligent Traffic Management System",
-            "objective": "Implement AI-driven traffic management to reduce congestion and improve road safety",
-            "implementation": f"Deploy {dataset_name} in smart traffic control systems for real-time optimization and predictive management",
-            "strategic_alignment": [
-                "Smart Cities Development",
-                "Road safety improvement goals",
-                "Environmental protection targets",
-                "Digital government initiatives"
-            ],
-            "impact_areas": [
-                "Traffic Flow Optimization",
-                "Road Safety Enhancement",
-                "Air Quality Improvement",
-                "Economic Productivity",
-                "Citizen Satisfaction"
-            ],
-            "priority": "medium",
-            "timeline": "2024-2026",
-            "resources_required": [
-                "Traffic management authorities",
-                "Smart traffic infrastructure",
-                "AI analytics platforms",
-                "Emergency response coordination",
-                "Public awareness campaigns"
-            ],
-            "success_metrics": [
-                "Traffic flow improvement rates",
-                "Accident reduction percentage",
-                "Emergency response times",
-                "Fuel consumption reduction",
-                "Air quality indicators"
-            ]
-        }
+        return self._fill_template(_TRAFFIC_USE_CASE, dataset_name)
     
     def _generate_fallback_use_case(self, dataset_name: str, description: str) -> Dict[str, Any]:
         """Generate generic transportation use case."""
-        return {
-            "title": "Transportation Data Analytics Initiative",
-            "objective": "Leverage transportation data for strategic planning and system optimization",
-            "implementation": f"Implement analysis of {dataset_name} to support transportation sector strategic planning",
-            "strategic_alignment": [
-                "Vision 2030 Transportation Goals",
-                "National Transportation Strategy",
-                "Data-Driven Transportation Planning"
-            ],
-            "impact_areas": [
-                "Strategic Planning",
-                "System Optimization",
-                "Transportation Management"
-            ],
-            "priority": "medium",
-            "timeline": "2024-2025",
-            "resources_required": [
-                "Transportation analytics team",
-                "Data processing infrastructure",
-                "Stakeholder coordination"
-            ],
-            "success_metrics": [
-                "Data utilization effectiveness",
-                "Planning process improvement",
-                "System performance indicators"
-            ]
-        }
\ No newline at end of file
+        return self._fill_template(_FALLBACK_USE_CASE, dataset_name)
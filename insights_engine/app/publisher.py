@@ -2,10 +2,199 @@
 Open Data Publisher - Analyzes global datasets and recommends publishing strategies
 """
 
-from typing import Dict, List, Any, Optional
+from array import array
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Any, Mapping, NamedTuple, Optional, Sequence, Tuple
 import logging
+import os
+import threading
 from datetime import datetime
-import json
+
+import orjson
+
+try:
+    import ijson
+except ImportError:  # fall back to parsing the whole repository file with orjson
+    ijson = None
+
+
+# Sort keys for recommendations; every recommendation built here carries both scores
+_BY_STRATEGIC_SCORE = itemgetter("strategic_score")
+_BY_PLAN_PRIORITY = itemgetter("strategic_score", "public_value_score")
+
+# Alignment score added per (objective, keyword) match
+_OBJECTIVE_MATCH_SCORE = 0.2
+# Recommendations scoring above this count as strong strategic matches
+_STRONG_MATCH_SCORE = 0.7
+
+# Distinct (domain, objectives) queries whose scored datasets each publisher keeps
+_SCORE_CACHE_SIZE = 256
+# Repository versions (path, mtime, size) whose dataset tables stay loaded
+_TABLE_CACHE_SIZE = 4
+
+# Read size when streaming the global repository file
+_REPOSITORY_BUFFER_SIZE = 16 * 1024 * 1024
+
+# Publishing priority by the number of thresholds a combined score reaches
+_PRIORITY_THRESHOLDS = (0.6, 0.8)
+_PRIORITY_LEVELS = ("low", "medium", "high")
+
+# Impact factor weights for the overall score, and the recommendation by the
+# number of thresholds that score reaches
+_IMPACT_WEIGHTS = MappingProxyType({
+    "strategic_alignment": 0.4,
+    "public_value": 0.3,
+    "innovation_potential": 0.2,
+    "transparency_impact": 0.1
+})
+_RECOMMENDATION_THRESHOLDS = (0.4, 0.6, 0.8)
+_RECOMMENDATIONS = ("not_recommended", "conditional", "recommended", "highly_recommended")
+
+# Simulated global repository, used until a repository file is available
+_SAMPLE_GLOBAL_DATASETS = tuple(MappingProxyType(dataset) for dataset in [
+    {
+        "name": "National Energy Consumption Patterns",
+        "domain": "energy",
+        "description": "Comprehensive energy usage data across sectors",
+        "strategic_keywords": ("energy", "consumption", "efficiency", "sustainability"),
+        "publication_count": 156,  # How many similar datasets exist globally
+        "demand_score": 0.85,
+        "innovation_potential": 0.9
+    },
+    {
+        "name": "Urban Mobility Analytics",
+        "domain": "transportation",
+        "description": "Real-time and historical traffic flow data",
+        "strategic_keywords": ("mobility", "traffic", "smart city", "transportation"),
+        "publication_count": 89,
+        "demand_score": 0.78,
+        "innovation_potential": 0.82
+    },
+    {
+        "name": "Healthcare Resource Distribution",
+        "domain": "healthcare",
+        "description": "Geographic distribution of healthcare facilities and resources",
+        "strategic_keywords": ("healthcare", "accessibility", "resource planning"),
+        "publication_count": 203,
+        "demand_score": 0.71,
+        "innovation_potential": 0.75
+    }
+])
+
+# Strategic priorities per domain, shared read-only by every publisher
+_STRATEGIC_PRIORITIES = MappingProxyType({
+    "energy": (
+        "renewable energy expansion",
+        "energy efficiency improvement",
+        "grid modernization",
+        "carbon footprint reduction"
+    ),
+    "transportation": (
+        "smart mobility development",
+        "public transport optimization",
+        "logistics hub establishment",
+        "traffic congestion reduction"
+    ),
+    "healthcare": (
+        "healthcare accessibility improvement",
+        "preventive care enhancement",
+        "health system efficiency",
+        "medical innovation support"
+    )
+})
+
+# Evaluation criteria weights, shared read-only by every publisher
+_EVALUATION_CRITERIA = MappingProxyType({
+    "strategic_alignment": MappingProxyType({
+        "vision_2030_alignment": 0.4,
+        "sector_specific_goals": 0.3,
+        "international_commitments": 0.2,
+        "innovation_objectives": 0.1
+    }),
+    "public_value": MappingProxyType({
+        "citizen_benefit": 0.4,
+        "business_value": 0.3,
+        "academic_research": 0.2,
+        "government_efficiency": 0.1
+    })
+})
+
+
+class _DatasetTable(NamedTuple):
+    """
+    Global datasets as parallel columns; row i of every column describes
+    dataset i. Keywords are lowercased once, when the table is built.
+    """
+    records: Tuple[Mapping[str, Any], ...]
+    domains: Tuple[Optional[str], ...]
+    keywords: Tuple[Tuple[str, ...], ...]
+    # Inverted index of the rows relevant to each domain, by their own domain
+    # or a strategic keyword; postings are int32 arrays in row order
+    domain_index: Mapping[str, array]
+
+
+def _iter_global_datasets(path: str) -> Iterator[Mapping[str, Any]]:
+    """
+    Stream the records of the global repository file, a JSON array of
+    dataset objects, without materializing the parsed document.
+    
+    Yields the simulated sample repository when the file does not exist.
+    """
+    if not os.path.isfile(path):
+        yield from _SAMPLE_GLOBAL_DATASETS
+        return
+    
+    with open(path, 'rb') as f:
+        if ijson is None:
+            records = orjson.loads(f.read())
+        else:
+            records = ijson.items(f, 'item', buf_size=_REPOSITORY_BUFFER_SIZE, use_float=True)
+        for record in records:
+            yield MappingProxyType(record)
+
+
+def _build_dataset_table(records: Iterable[Mapping[str, Any]]) -> _DatasetTable:
+    """Lay dataset records out as a _DatasetTable, consuming them in one pass."""
+    stored = []
+    domains = []
+    keywords = []
+    domain_index = defaultdict(lambda: array('i'))
+    for row, record in enumerate(records):
+        domain = record.get('domain')
+        strategic_keywords = record.get('strategic_keywords', ())
+        stored.append(record)
+        domains.append(domain)
+        keywords.append(tuple(keyword.lower() for keyword in strategic_keywords))
+        for relevant_domain in dict.fromkeys((domain, *strategic_keywords)):
+            domain_index[relevant_domain].append(row)
+    return _DatasetTable(
+        records=tuple(stored),
+        domains=tuple(domains),
+        keywords=tuple(keywords),
+        domain_index=MappingProxyType(dict(domain_index))
+    )
+
+
+def _repository_version(path: str) -> Optional[Tuple[int, int]]:
+    """Return the (mtime_ns, size) of a repository file, or None when it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=_TABLE_CACHE_SIZE)
+def _load_dataset_table(path: str, version: Optional[Tuple[int, int]]) -> _DatasetTable:
+    """
+    Stream a global repository into a _DatasetTable, once per process, path
+    and file version; version only keys the cache, so a replaced file is
+    loaded afresh.
+    """
+    return _build_dataset_table(_iter_global_datasets(path))
 
 
 class OpenDataPublisher:
@@ -19,6 +208,11 @@ class OpenDataPublisher:
         self.global_data_repository = global_data_repository or "global_datasets.json"
         self.strategic_priorities = self._load_strategic_priorities()
         self.evaluation_criteria = self._load_evaluation_criteria()
+        
+        # (dataset table, result) by (domain, objectives), least recently used
+        # first; entries scored against an older table are recomputed
+        self._score_cache = OrderedDict()
+        self._score_cache_lock = threading.Lock()
     
     def analyze_publishing_opportunities(self, entity_scope: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -42,26 +236,20 @@ class OpenDataPublisher:
             "strategic_matches": 0
         }
         
-        # Load global dataset repository
-        global_datasets = self._load_global_datasets()
-        
-        # Filter datasets by domain relevance
-        relevant_datasets = self._filter_by_domain(global_datasets, entity_scope)
-        
-        # Score datasets by strategic alignment
-        scored_datasets = self._score_strategic_alignment(relevant_datasets, entity_scope)
+        # Filter and score the global datasets; repeat queries are cached
+        total_analyzed, scored_datasets = self._score_global_datasets(entity_scope)
         
         # Generate publishing recommendations
-        recommendations = self._generate_recommendations(scored_datasets, entity_scope)
+        recommendations, strategic_matches = self._generate_recommendations(scored_datasets, entity_scope)
         
         analysis_log["recommendations_generated"] = len(recommendations)
-        analysis_log["strategic_matches"] = len([r for r in recommendations if r["strategic_score"] > 0.7])
+        analysis_log["strategic_matches"] = strategic_matches
         
         return {
             "recommendations": recommendations,
             "analysis_log": analysis_log,
             "entity_scope": entity_scope,
-            "total_analyzed": len(relevant_datasets)
+            "total_analyzed": total_analyzed
         }
     
     def evaluate_publishing_impact(self, dataset_metadata: Dict[str, Any], entity_scope: Dict[str, Any]) -> Dict[str, Any]:
@@ -103,26 +291,16 @@ class OpenDataPublisher:
         evaluation["transparency_impact"] = self._evaluate_transparency_impact(dataset_metadata)
         
         # Calculate overall score
-        weights = {
-            "strategic_alignment": 0.4,
-            "public_value": 0.3,
-            "innovation_potential": 0.2,
-            "transparency_impact": 0.1
-        }
-        
-        evaluation["overall_score"] = sum(
-            evaluation[factor] * weight for factor, weight in weights.items()
+        overall_score = sum(
+            evaluation[factor] * weight for factor, weight in _IMPACT_WEIGHTS.items()
         )
+        evaluation["overall_score"] = overall_score
         
-        # Generate recommendation
-        if evaluation["overall_score"] >= 0.8:
-            evaluation["recommendation"] = "highly_recommended"
-        elif evaluation["overall_score"] >= 0.6:
-            evaluation["recommendation"] = "recommended"
-        elif evaluation["overall_score"] >= 0.4:
-            evaluation["recommendation"] = "conditional"
-        else:
-            evaluation["recommendation"] = "not_recommended"
+        # Generate recommendation; comparisons count as 0/1, so no if/elif ladder
+        low, mid, high = _RECOMMENDATION_THRESHOLDS
+        evaluation["recommendation"] = _RECOMMENDATIONS[
+            (overall_score >= low) + (overall_score >= mid) + (overall_score >= high)
+        ]
         
         # Identify risk factors and mitigation strategies
         evaluation["risk_factors"] = self._identify_risk_factors(dataset_metadata)
@@ -154,11 +332,15 @@ class OpenDataPublisher:
         }
         
         # Sort recommendations by priority
-        prioritized_recommendations = sorted(
-            recommendations, 
-            key=lambda x: (x.get("strategic_score", 0), x.get("public_value_score", 0)), 
-            reverse=True
-        )
+        try:
+            prioritized_recommendations = sorted(recommendations, key=_BY_PLAN_PRIORITY, reverse=True)
+        except KeyError:
+            # Recommendations from outside this publisher may lack a score
+            prioritized_recommendations = sorted(
+                recommendations, 
+                key=lambda x: (x.get("strategic_score", 0), x.get("public_value_score", 0)), 
+                reverse=True
+            )
         
         # Create phased implementation plan
         max_capacity = entity_capacity.get("datasets_per_quarter", 2)
@@ -199,121 +381,120 @@ class OpenDataPublisher:
         
         return plan
     
-    def _load_global_datasets(self) -> List[Dict[str, Any]]:
-        """Load global dataset repository (simulated)."""
-        # In a real implementation, this would load from the actual 1.8M+ dataset repository
-        return [
-            {
-                "name": "National Energy Consumption Patterns",
-                "domain": "energy",
-                "description": "Comprehensive energy usage data across sectors",
-                "strategic_keywords": ["energy", "consumption", "efficiency", "sustainability"],
-                "publication_count": 156,  # How many similar datasets exist globally
-                "demand_score": 0.85,
-                "innovation_potential": 0.9
-            },
-            {
-                "name": "Urban Mobility Analytics",
-                "domain": "transportation",
-                "description": "Real-time and historical traffic flow data",
-                "strategic_keywords": ["mobility", "traffic", "smart city", "transportation"],
-                "publication_count": 89,
-                "demand_score": 0.78,
-                "innovation_potential": 0.82
-            },
-            {
-                "name": "Healthcare Resource Distribution",
-                "domain": "healthcare",
-                "description": "Geographic distribution of healthcare facilities and resources",
-                "strategic_keywords": ["healthcare", "accessibility", "resource planning"],
-                "publication_count": 203,
-                "demand_score": 0.71,
-                "innovation_potential": 0.75
-            }
-        ]
+    def _global_dataset_table(self) -> _DatasetTable:
+        """
+        Column layout of the global dataset repository, loaded once per
+        process and file version and shared read-only by every analysis.
+        """
+        path = self.global_data_repository
+        return _load_dataset_table(path, _repository_version(path))
     
-    def _load_strategic_priorities(self) -> Dict[str, List[str]]:
+    def _load_strategic_priorities(self) -> Mapping[str, Tuple[str, ...]]:
         """Load strategic priorities for different domains."""
-        return {
-            "energy": [
-                "renewable energy expansion",
-                "energy efficiency improvement",
-                "grid modernization",
-                "carbon footprint reduction"
-            ],
-            "transportation": [
-                "smart mobility development",
-                "public transport optimization",
-                "logistics hub establishment",
-                "traffic congestion reduction"
-            ],
-            "healthcare": [
-                "healthcare accessibility improvement",
-                "preventive care enhancement",
-                "health system efficiency",
-                "medical innovation support"
-            ]
-        }
+        return _STRATEGIC_PRIORITIES
     
-    def _load_evaluation_criteria(self) -> Dict[str, Dict[str, float]]:
+    def _load_evaluation_criteria(self) -> Mapping[str, Mapping[str, float]]:
         """Load evaluation criteria with weights."""
-        return {
-            "strategic_alignment": {
-                "vision_2030_alignment": 0.4,
-                "sector_specific_goals": 0.3,
-                "international_commitments": 0.2,
-                "innovation_objectives": 0.1
-            },
-            "public_value": {
-                "citizen_benefit": 0.4,
-                "business_value": 0.3,
-                "academic_research": 0.2,
-                "government_efficiency": 0.1
-            }
-        }
+        return _EVALUATION_CRITERIA
+    
+    def _score_global_datasets(self, entity_scope: Dict[str, Any]) -> Tuple[int, Sequence[Mapping[str, Any]]]:
+        """
+        Filter the global datasets by domain and score them for an entity
+        scope, returning (datasets analyzed, scored datasets).
+        
+        Only the domain and strategic objectives affect the result, so
+        queries repeating them are served from a per-publisher cache.
+        """
+        global_datasets = self._global_dataset_table()
+        domain = entity_scope.get('domain', '')
+        objectives = entity_scope.get('strategic_objectives', [])
+        if not (isinstance(domain, str) and all(isinstance(objective, str) for objective in objectives)):
+            return self._filter_and_score(global_datasets, entity_scope)
+        
+        key = (domain, tuple(objectives))
+        with self._score_cache_lock:
+            cached = self._score_cache.get(key)
+            if cached is not None and cached[0] is global_datasets:
+                self._score_cache.move_to_end(key)
+                return cached[1]
+        
+        total_analyzed, scored_datasets = self._filter_and_score(
+            global_datasets, {'domain': domain, 'strategic_objectives': key[1]}
+        )
+        # Cached results are shared between callers, so they are read-only
+        result = (total_analyzed, tuple(MappingProxyType(dataset) for dataset in scored_datasets))
+        
+        with self._score_cache_lock:
+            self._score_cache[key] = (global_datasets, result)
+            self._score_cache.move_to_end(key)
+            if len(self._score_cache) > _SCORE_CACHE_SIZE:
+                self._score_cache.popitem(last=False)
+        return result
+    
+    def _filter_and_score(self, global_datasets: _DatasetTable,
+                          entity_scope: Dict[str, Any]) -> Tuple[int, List[Dict[str, Any]]]:
+        """Filter the global datasets by domain relevance and score them by strategic alignment."""
+        relevant_rows = self._filter_by_domain(global_datasets, entity_scope)
+        scored_datasets = self._score_strategic_alignment(global_datasets, relevant_rows, entity_scope)
+        return len(relevant_rows), scored_datasets
     
-    def _filter_by_domain(self, datasets: List[Dict[str, Any]], 
-                         entity_scope: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Filter datasets by domain relevance."""
+    def _filter_by_domain(self, datasets: _DatasetTable, 
+                         entity_scope: Dict[str, Any]) -> Sequence[int]:
+        """Filter datasets by domain relevance, returning the relevant rows."""
         target_domain = entity_scope.get('domain', '')
         
         if not target_domain:
-            return datasets
+            return range(len(datasets.records))
         
-        return [
-            dataset for dataset in datasets 
-            if dataset.get('domain') == target_domain or 
-               target_domain in dataset.get('strategic_keywords', [])
-        ]
+        # Domains and keywords are strings, so nothing else can match
+        if not isinstance(target_domain, str):
+            return ()
+        
+        return datasets.domain_index.get(target_domain, ())
     
-    def _score_strategic_alignment(self, datasets: List[Dict[str, Any]], 
+    def _score_strategic_alignment(self, datasets: _DatasetTable, rows: Sequence[int], 
                                  entity_scope: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Score datasets based on strategic alignment."""
-        strategic_objectives = entity_scope.get('strategic_objectives', [])
-        
-        for dataset in datasets:
-            alignment_score = 0.0
-            
-            # Check alignment with strategic objectives
-            dataset_keywords = dataset.get('strategic_keywords', [])
-            
-            for objective in strategic_objectives:
-                for keyword in dataset_keywords:
-                    if keyword.lower() in objective.lower():
-                        alignment_score += 0.2
+        """Score copies of the given dataset rows based on strategic alignment."""
+        # Lowercase the objectives once rather than once per dataset keyword
+        objectives = [objective.lower() for objective in entity_scope.get('strategic_objectives', [])]
+        
+        records = datasets.records
+        keywords = datasets.keywords
+        # Objectives containing each keyword; keywords recur across datasets,
+        # so each distinct keyword is checked against the objectives only once
+        objective_hits = {}
+        scored_datasets = []
+        for row in rows:
+            # Check alignment with strategic objectives: every keyword found in
+            # an objective counts once per objective
+            matches = 0
+            for keyword in keywords[row]:
+                hits = objective_hits.get(keyword)
+                if hits is None:
+                    hits = objective_hits[keyword] = sum(keyword in objective for objective in objectives)
+                matches += hits
             
             # Normalize score
-            dataset['strategic_score'] = min(1.0, alignment_score)
+            scored_datasets.append({**records[row], 'strategic_score': min(1.0, matches * _OBJECTIVE_MATCH_SCORE)})
         
-        return datasets
+        return scored_datasets
     
-    def _generate_recommendations(self, datasets: List[Dict[str, Any]], 
-                                entity_scope: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate publishing recommendations."""
+    def _generate_recommendations(self, datasets: Sequence[Mapping[str, Any]], 
+                                entity_scope: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Generate publishing recommendations.
+        
+        Returns:
+            Tuple of (recommendations sorted by strategic score, number of
+            strong strategic matches among them)
+        """
         recommendations = []
+        strategic_matches = 0
         
         for dataset in datasets:
-            if dataset.get('strategic_score', 0) > 0.3:  # Minimum threshold
+            strategic_score = dataset.get('strategic_score', 0)
+            if strategic_score > 0.3:  # Minimum threshold
+                strategic_matches += strategic_score > _STRONG_MATCH_SCORE
                 recommendation = {
                     "dataset_name": dataset['name'],
                     "domain": dataset['domain'],
@@ -328,7 +509,7 @@ class OpenDataPublisher:
                 }
                 recommendations.append(recommendation)
         
-        return sorted(recommendations, key=lambda x: x['strategic_score'], reverse=True)
+        return sorted(recommendations, key=_BY_STRATEGIC_SCORE, reverse=True), strategic_matches
     
     def _determine_priority(self, dataset: Dict[str, Any]) -> str:
         """Determine priority level for dataset publishing."""
@@ -337,12 +518,8 @@ class OpenDataPublisher:
         
         combined_score = (strategic_score * 0.6) + (demand_score * 0.4)
         
-        if combined_score >= 0.8:
-            return "high"
-        elif combined_score >= 0.6:
-            return "medium"
-        else:
-            return "low"
+        medium, high = _PRIORITY_THRESHOLDS
+        return _PRIORITY_LEVELS[(combined_score >= medium) + (combined_score >= high)]
     
     def _assess_complexity(self, dataset: Dict[str, Any]) -> str:
         """Assess implementation complexity."""
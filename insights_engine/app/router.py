@@ -2,15 +2,31 @@
 Expert Router - Routes dataset contexts to appropriate domain experts
 """
 
-from typing import Dict, List, Any, Tuple
+from typing import Dict, Iterator, List, Any, Optional, Set, Tuple
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import atexit
 import logging
+import os
+import queue
+import threading
+import time
 from datetime import datetime
-import json
+import orjson
 
+from ._keyword_matcher import build_keyword_matcher, find_keywords
 from .experts.base_expert import BaseExpert
 from .experts.energy_efficiency import EnergyEfficiencyExpert
 
 
+# The routing log writer appends up to this many queued logs at once, waiting
+# at most this many seconds for a batch to fill
+_LOG_BATCH_SIZE = 256
+_LOG_FLUSH_INTERVAL = 1.0
+# Seconds to wait at exit for the writer to flush queued logs
+_LOG_SHUTDOWN_TIMEOUT = 5.0
+
+
 class ExpertRouter:
     """
     Routes dataset contexts to appropriate domain experts using
@@ -19,6 +35,14 @@ class ExpertRouter:
     
     def __init__(self):
         self.experts: List[BaseExpert] = []
+        # Routing indexes over the experts, see _index_experts()
+        self._experts_by_domain: Dict[str, List[BaseExpert]] = {}
+        self._experts_by_keyword: Dict[str, List[BaseExpert]] = {}
+        self._unindexed_experts: List[BaseExpert] = []
+        # (log_dir, routing_log) entries for the background writer, see save_routing_log()
+        self._log_queue = queue.SimpleQueue()
+        self._log_writer: Optional[threading.Thread] = None
+        self._log_writer_lock = threading.Lock()
         self.logger = logging.getLogger('expert_router')
         self._initialize_experts()
     
@@ -32,9 +56,66 @@ class ExpertRouter:
             # EducationExpert(),
             # etc.
         ]
+        self._index_experts()
         
         self.logger.info(f"Initialized {len(self.experts)} domain experts")
     
+    def _index_experts(self):
+        """
+        Build the domain -> experts and keyword -> experts routing indexes.
+        
+        Experts that declare no routing domains are kept aside and evaluated
+        on every context.
+        """
+        experts_by_domain = defaultdict(list)
+        experts_by_keyword = defaultdict(list)
+        unindexed = []
+        
+        for expert in self.experts:
+            routing_domains = expert.get_routing_domains()
+            if routing_domains is None:
+                unindexed.append(expert)
+                continue
+            for domain in routing_domains:
+                experts_by_domain[domain].append(expert)
+            for keyword in expert.get_domain_keywords():
+                experts_by_keyword[keyword].append(expert)
+        
+        self._experts_by_domain = dict(experts_by_domain)
+        self._experts_by_keyword = dict(experts_by_keyword)
+        self._unindexed_experts = unindexed
+        # One matcher over every indexed keyword, to find experts with keywords in the text
+        self._keyword_pattern, self._keyword_prefixes = build_keyword_matcher(experts_by_keyword)
+    
+    def _candidate_experts(self, context: Dict[str, Any]) -> Set[BaseExpert]:
+        """
+        Find the experts that may handle a context: those routed its domains,
+        its keywords or keywords found in its name and description, plus the
+        unindexed experts.
+        
+        Args:
+            context: Dataset context
+        
+        Returns:
+            Set of candidate experts
+        """
+        candidates = set(self._unindexed_experts)
+        experts_by_domain = self._experts_by_domain
+        experts_by_keyword = self._experts_by_keyword
+        
+        for domain in context.get('domain_classification', ()):
+            candidates.update(experts_by_domain.get(domain, ()))
+        
+        for keyword in BaseExpert._lowered_keywords(context):
+            candidates.update(experts_by_keyword.get(keyword, ()))
+        
+        text_keywords = find_keywords(self._keyword_pattern, self._keyword_prefixes,
+                                      BaseExpert._lowered_text(context))
+        for keyword in text_keywords:
+            candidates.update(experts_by_keyword[keyword])
+        
+        return candidates
+    
     def route_to_experts(self, context: Dict[str, Any]) -> Tuple[List[BaseExpert], Dict[str, Any]]:
         """
         Route dataset context to appropriate experts.
@@ -45,8 +126,10 @@ class ExpertRouter:
         Returns:
             Tuple of (selected_experts, routing_log)
         """
+        # One timestamp for the whole routing pass and its decisions
+        timestamp = datetime.now().isoformat()
         routing_log = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "dataset_name": context.get('name', 'Unknown'),
             "routing_decisions": [],
             "selected_experts": [],
@@ -54,17 +137,29 @@ class ExpertRouter:
         }
         
         selected_experts = []
+        candidates = self._candidate_experts(context)
         
         for expert in self.experts:
+            if expert not in candidates:
+                # Outside the expert's domains and keywords, so it cannot handle the context
+                routing_log["routing_decisions"].append({
+                    "expert_name": expert.name,
+                    "expert_domain": expert.domain,
+                    "can_handle": False,
+                    "alignment_score": 0.0,
+                    "decision_timestamp": timestamp
+                })
+                continue
+            
             try:
-                can_handle = expert.can_handle(context)
+                can_handle, alignment_score = expert.evaluate(context)
                 
                 decision_log = {
                     "expert_name": expert.name,
                     "expert_domain": expert.domain,
                     "can_handle": can_handle,
-                    "alignment_score": expert.assess_strategic_alignment(context) if can_handle else 0.0,
-                    "decision_timestamp": datetime.now().isoformat()
+                    "alignment_score": alignment_score,
+                    "decision_timestamp": timestamp
                 }
                 
                 routing_log["routing_decisions"].append(decision_log)
@@ -84,7 +179,7 @@ class ExpertRouter:
                     "expert_domain": expert.domain,
                     "can_handle": False,
                     "error": str(e),
-                    "decision_timestamp": datetime.now().isoformat()
+                    "decision_timestamp": timestamp
                 }
                 routing_log["routing_decisions"].append(decision_log)
         
@@ -127,29 +222,14 @@ class ExpertRouter:
         
         use_cases = []
         
-        for expert in experts:
-            try:
-                use_case = expert.generate_use_case(context)
-                if expert.validate_use_case(use_case):
-                    use_case["generated_by"] = {
-                        "expert_name": expert.name,
-                        "expert_domain": expert.domain,
-                        "generation_timestamp": datetime.now().isoformat()
-                    }
-                    use_cases.append(use_case)
-                    generation_log["use_cases_generated"] += 1
-                else:
-                    self.logger.warning(f"Invalid use case generated by {expert.name}")
-                    generation_log["generation_errors"].append({
-                        "expert": expert.name,
-                        "error": "Use case validation failed"
-                    })
-                    
-            except Exception as e:
-                self.logger.error(f"Error generating use case with {expert.name}: {str(e)}")
+        for expert, use_case, error in self.iter_use_cases(context, experts):
+            if use_case is not None:
+                use_cases.append(use_case)
+                generation_log["use_cases_generated"] += 1
+            else:
                 generation_log["generation_errors"].append({
                     "expert": expert.name,
-                    "error": str(e)
+                    "error": error
                 })
         
         return {
@@ -159,6 +239,47 @@ class ExpertRouter:
             "context": context
         }
     
+    def iter_use_cases(self, context: Dict[str, Any],
+                       experts: List[BaseExpert]) -> Iterator[Tuple[BaseExpert, Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Yield each expert's result as (expert, use_case, error), in routing order.
+        
+        Experts are independent, so several run concurrently; each result is
+        yielded as soon as it and the ones before it are ready.
+        """
+        if len(experts) > 1:
+            with ThreadPoolExecutor(max_workers=len(experts)) as executor:
+                results = executor.map(lambda expert: self._run_expert(expert, context), experts)
+                for expert, (use_case, error) in zip(experts, results):
+                    yield expert, use_case, error
+        else:
+            for expert in experts:
+                yield (expert, *self._run_expert(expert, context))
+    
+    def _run_expert(self, expert: BaseExpert, context: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Generate and validate one expert's use case.
+        
+        Returns:
+            Tuple of (use_case, None) on success or (None, error message)
+        """
+        try:
+            use_case = expert.generate_use_case(context)
+            if expert.validate_use_case(use_case):
+                use_case["generated_by"] = {
+                    "expert_name": expert.name,
+                    "expert_domain": expert.domain,
+                    "generation_timestamp": datetime.now().isoformat()
+                }
+                return use_case, None
+            
+            self.logger.warning(f"Invalid use case generated by {expert.name}")
+            return None, "Use case validation failed"
+            
+        except Exception as e:
+            self.logger.error(f"Error generating use case with {expert.name}: {str(e)}")
+            return None, str(e)
+    
     def _select_fallback_expert(self, context: Dict[str, Any]) -> BaseExpert:
         """
         Select the most relevant expert when no expert can handle the context.
@@ -198,27 +319,90 @@ class ExpertRouter:
     
     def save_routing_log(self, routing_log: Dict[str, Any], log_dir: str = "logs"):
         """
-        Save routing log to file for audit purposes.
+        Queue a routing log to be saved for audit purposes.
+        
+        A background writer appends queued logs in batches as NDJSON lines to
+        a daily file in log_dir, so the caller never waits on the disk. The
+        routing log must not be modified after it is queued.
         
         Args:
             routing_log: Routing log dictionary
             log_dir: Directory to save logs
         """
-        try:
-            import os
-            os.makedirs(log_dir, exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            dataset_name = routing_log.get("dataset_name", "unknown").replace(" ", "_")
-            filename = f"{log_dir}/routing_log_{dataset_name}_{timestamp}.json"
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(routing_log, f, indent=2, ensure_ascii=False)
+        if self._log_writer is None:
+            self._start_log_writer()
+        self._log_queue.put((log_dir, routing_log))
+    
+    def _start_log_writer(self):
+        """Start the routing log writer thread on first use."""
+        with self._log_writer_lock:
+            if self._log_writer is not None:
+                return
+            self._log_writer = threading.Thread(target=self._writer_loop, name="routing-log-writer", daemon=True)
+            self._log_writer.start()
+            atexit.register(self._stop_log_writer)
+    
+    def _stop_log_writer(self):
+        """Have the writer flush the queued logs and stop, waiting a bounded time."""
+        self._log_queue.put(None)
+        self._log_writer.join(_LOG_SHUTDOWN_TIMEOUT)
+    
+    def _writer_loop(self):
+        """
+        Drain the log queue until stopped, writing up to _LOG_BATCH_SIZE logs
+        or whatever arrived within _LOG_FLUSH_INTERVAL seconds at a time.
+        """
+        log_queue = self._log_queue
+        stopping = False
+        
+        while not stopping:
+            entry = log_queue.get()
+            if entry is None:
+                break
             
-            self.logger.info(f"Routing log saved to {filename}")
+            batch = [entry]
+            deadline = time.monotonic() + _LOG_FLUSH_INTERVAL
+            while len(batch) < _LOG_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = log_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
             
-        except Exception as e:
-            self.logger.error(f"Failed to save routing log: {str(e)}")
+            self._write_log_batch(batch)
+    
+    def _write_log_batch(self, batch: List[Tuple[str, Dict[str, Any]]]):
+        """
+        Append a batch of routing logs as NDJSON lines, one write per log directory.
+        
+        Args:
+            batch: (log_dir, routing_log) entries
+        """
+        lines_by_dir = defaultdict(list)
+        for log_dir, routing_log in batch:
+            try:
+                lines_by_dir[log_dir].append(orjson.dumps(routing_log, option=orjson.OPT_NON_STR_KEYS))
+            except Exception as e:
+                self.logger.error(f"Failed to save routing log: {str(e)}")
+        
+        filename = f"routing_log_{datetime.now().strftime('%Y%m%d')}.ndjson"
+        for log_dir, lines in lines_by_dir.items():
+            try:
+                os.makedirs(log_dir, exist_ok=True)
+                path = os.path.join(log_dir, filename)
+                with open(path, 'ab') as f:
+                    f.write(b"\n".join(lines) + b"\n")
+                
+                self.logger.info(f"Saved {len(lines)} routing logs to {path}")
+                
+            except Exception as e:
+                self.logger.error(f"Failed to save routing logs: {str(e)}")
     
     def get_routing_statistics(self) -> Dict[str, Any]:
         """
@@ -65,6 +65,13 @@ class Config:
     CACHE_TYPE = 'SimpleCache'
     CACHE_DEFAULT_TIMEOUT = 3600  # 1 hour
     
+    # Response Compression (Flask-Compress)
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_MIN_SIZE = 1024
+    COMPRESS_LEVEL = 4
+    COMPRESS_BR_LEVEL = 4
+    COMPRESS_STREAMS = False  # keep NDJSON responses streaming
+    
     @staticmethod
     def init_app(app):
         """Initialize application with configuration."""
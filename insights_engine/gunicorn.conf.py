@@ -0,0 +1,26 @@
+"""
+Gunicorn settings for the Insights Engine
+
+Requests mostly wait on the expert router and data loader, so cooperative
+gevent workers serve many connections each instead of one per process.
+"""
+
+import multiprocessing
+import os
+
+# app.py applies the gevent monkey patch when this is set
+os.environ.setdefault('INSIGHTS_GEVENT', '1')
+
+wsgi_app = 'wsgi:app'
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+worker_class = 'gevent'
+worker_connections = 1000
+workers = multiprocessing.cpu_count() * 2 + 1
+
+# Import the app once in the master; its components are built per worker
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Build the app's components before the worker takes requests."""
+    server.app.wsgi().extensions['services'].warm()
@@ -0,0 +1,15 @@
+"""
+WSGI entry point for production servers
+"""
+
+import importlib.util
+import os
+
+# The app/ package shadows app.py on import, so load the factory module by path
+_spec = importlib.util.spec_from_file_location(
+    'insights_engine_app', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+
+app = _module.create_app(os.environ.get('INSIGHTS_CONFIG', 'production'))